@@ -51,7 +51,7 @@ async def get_satellite_health(
         if refresh:
             logger.info("Refreshing satellite health status (user-triggered)")
             try:
-                await service.update_all_satellite_status(db)
+                await service.update_all_satellite_status(db, force=True)
             except EarthEngineQuotaError:
                 logger.warning("Earth Engine quota exceeded during health check")
                 raise HTTPException(
@@ -190,7 +190,7 @@ async def refresh_satellite_health(
         service = SatelliteHealthService()
 
         try:
-            await service.update_all_satellite_status(db)
+            await service.update_all_satellite_status(db, force=True)
             logger.info("Satellite health refresh completed successfully")
 
             return {
@@ -35,12 +35,22 @@ class Settings(BaseSettings):
     """Maximum number of retries for GEE quota errors"""
     GEE_RETRY_DELAY: int = 1
     """Initial retry delay in seconds (exponential backoff applied)"""
+    EE_CACHE_ENABLED: bool = True
+    """Cache Earth Engine time series results on disk"""
+    EE_CACHE_DIR: str = "/tmp/ee_cache"
+    """Directory for the Earth Engine result cache"""
+    EE_CACHE_TTL_SECONDS: int = 86400
+    """How long cached Earth Engine results stay valid"""
 
     # Satellite Health Monitoring
     SATELLITE_HEALTH_CHECK_ENABLED: bool = True
     """Enable periodic satellite health checks"""
     SATELLITE_HEALTH_CHECK_INTERVAL_HOURS: int = 1
     """Interval in hours between satellite health checks"""
+    SATELLITE_HEALTH_CACHE_TTL_SECONDS: int = 300
+    """How long a satellite health check result is reused (needs EE_CACHE_ENABLED)"""
+    SATELLITE_HEALTH_SUMMARY_TTL_SECONDS: int = 15
+    """How long the aggregated health summary is reused (0 disables)"""
 
     # Report Generation
     REPORTS_DIR: str = "reports"
@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.core.database import engine, init_db, AsyncSessionLocal
@@ -102,6 +103,8 @@ app = FastAPI(
     docs_url=f"{settings.API_V1_PREFIX}/docs",
     redoc_url=f"{settings.API_V1_PREFIX}/redoc",
     lifespan=lifespan,
+    # orjson serializes the large NDVI/carbon time series much faster
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -14,7 +14,10 @@ References:
 
 import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 from typing import Optional, List, Tuple
 import math
 
@@ -23,6 +26,89 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
+def _make_rng(seed: Optional[int] = None) -> np.random.Generator:
+    """Create a PCG64DXSM-backed generator; child streams come from .spawn()."""
+    return np.random.Generator(np.random.PCG64DXSM(seed))
+
+
+# Shared generator for Monte Carlo draws; creating one per call costs a
+# fresh OS-entropy seed each time. spawn() updates the generator's seed
+# sequence, so concurrent requests take _rng_lock around it.
+_rng = _make_rng()
+_rng_lock = threading.Lock()
+
+# Worker threads for multi-block Monte Carlo runs, shared by all requests.
+# Fixed size so concurrent estimates queue for blocks instead of each
+# starting its own pool (os.cpu_count() ignores container CPU limits).
+_mc_block_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="mc-block"
+)
+
+# Per-thread scratch arrays for Monte Carlo draws; block workers run on
+# separate threads, so each gets its own set.
+_mc_scratch = threading.local()
+
+
+def _mc_buffers(shape: Tuple[int, int]) -> Tuple[np.ndarray, ...]:
+    """
+    Return this thread's (a, b, ndvi, agb) scratch arrays for `shape`.
+
+    The arrays are reused across calls with the same shape and reallocated
+    when the shape changes. Their contents are overwritten on every use.
+    """
+    buffers = getattr(_mc_scratch, "buffers", None)
+    if buffers is None or buffers[0].shape != shape:
+        buffers = tuple(np.empty(shape) for _ in range(4))
+        _mc_scratch.buffers = buffers
+    return buffers
+
+
+def _allometric_biomass(
+    a: np.ndarray,
+    ndvi: np.ndarray,
+    b: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Evaluate AGB = a * NDVI^b element-wise with a single output buffer.
+
+    The power is only taken where NDVI is positive (zero elsewhere), so
+    negative NDVI samples never produce NaN intermediates, and results are
+    floored at zero in place. `out`, when given, receives the result.
+    """
+    if out is None:
+        agb = np.zeros_like(ndvi)
+    else:
+        agb = out
+        agb.fill(0.0)
+    np.power(ndvi, b, out=agb, where=ndvi > 0)
+    agb *= a
+    np.maximum(agb, 0.0, out=agb)
+    return agb
+
+
+def _percentiles(samples: np.ndarray, q: Tuple[float, ...]) -> np.ndarray:
+    """
+    Linear-interpolated percentiles along the last axis via one partition.
+
+    Matches np.percentile's default method but selects only the order
+    statistics needed (O(N) quickselect) instead of going through the
+    general percentile machinery.
+
+    Returns:
+        Array of shape (len(q),) + samples.shape[:-1]
+    """
+    n = samples.shape[-1]
+    positions = np.asarray(q, dtype=float) / 100.0 * (n - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    part = np.partition(samples, np.unique(np.concatenate([lower, upper])), axis=-1)
+    lower_values = np.moveaxis(part[..., lower], -1, 0)
+    upper_values = np.moveaxis(part[..., upper], -1, 0)
+    weight = (positions - lower).reshape((-1,) + (1,) * (samples.ndim - 1))
+    return lower_values + (upper_values - lower_values) * weight
+
+
 class CarbonCalculationError(Exception):
     """Exception for carbon calculation errors."""
 
@@ -71,6 +157,11 @@ class CarbonService:
 
     # Monte Carlo simulation configuration
     MONTE_CARLO_ITERATIONS = 10000
+    # Data points simulated together; larger batches are split into blocks of
+    # this many rows and run on worker threads
+    MONTE_CARLO_BLOCK_ROWS = 16
+    # Chunks drawn before an adaptive run may stop on convergence
+    MIN_CONVERGENCE_CHUNKS = 4
     CONFIDENCE_INTERVAL_PERCENTILES = (2.5, 97.5)
     MIN_CONFIDENCE_SCORE = 0
     MAX_CONFIDENCE_SCORE = 100
@@ -172,7 +263,7 @@ class CarbonService:
     }
 
     @classmethod
-    async def estimate_carbon_sequestration(
+    def estimate_carbon_sequestration(
         cls,
         ndvi_data: List[dict],
         area_ha: float,
@@ -204,6 +295,11 @@ class CarbonService:
                     - confidence_score (0-100, higher=more confident)
                     - ci_lower, ci_upper (95% confidence interval bounds)
                     - std_dev (standard deviation from Monte Carlo)
+                - arrays: The same series as columnar NumPy arrays (unrounded):
+                    - dates (datetime64[D]), ndvi
+                    - agb_tonnes_ha, carbon_tonnes_ha, co2_tonnes_ha
+                    - carbon_tonnes (farm total), confidence_score
+                    - ci_lower, ci_upper, std_dev
                 - statistics: Aggregated statistics with:
                     - mean_agb_tonnes_ha, total_agb_tonnes
                     - mean_carbon_tonnes_ha, total_carbon_tonnes
@@ -272,87 +368,82 @@ class CarbonService:
             cls._validate_allometric_params(allometric_params)
 
             # Calculate carbon with uncertainty quantification
-            data_points = []
-            agb_values = []
-            carbon_values = []
-            confidence_scores = []
-            std_devs = []
-
-            for point in ndvi_data:
-                ndvi = point["ndvi"]
-                ndvi_std = point.get("ndvi_std", cls.DEFAULT_NDVI_STD)
-
-                # Validate NDVI range
-                if not (-1.0 <= ndvi <= 1.0):
-                    raise CarbonCalculationError(
-                        f"Invalid NDVI value: {ndvi} (must be -1 to 1)"
-                    )
+            ndvi_values = np.array([point["ndvi"] for point in ndvi_data], dtype=float)
+            ndvi_stds = np.array(
+                [point.get("ndvi_std", cls.DEFAULT_NDVI_STD) for point in ndvi_data],
+                dtype=float,
+            )
 
-                # Run Monte Carlo simulation
-                try:
-                    mc_results = cls._run_monte_carlo_simulation(
-                        ndvi_value=ndvi,
-                        ndvi_std=ndvi_std,
-                        allometric_params=allometric_params,
-                        n_iterations=cls.MONTE_CARLO_ITERATIONS,
-                    )
-                except MonteCarloSimulationError as e:
-                    logger.error(f"Monte Carlo simulation failed for NDVI={ndvi}: {str(e)}")
-                    raise
+            # Validate NDVI range
+            invalid = ~((ndvi_values >= -1.0) & (ndvi_values <= 1.0))
+            if invalid.any():
+                ndvi = ndvi_data[int(np.argmax(invalid))]["ndvi"]
+                raise CarbonCalculationError(
+                    f"Invalid NDVI value: {ndvi} (must be -1 to 1)"
+                )
 
-                # Calculate confidence metrics
-                confidence_metrics = cls._calculate_confidence_metrics(mc_results)
+            # Run Monte Carlo simulation and reduce to confidence metrics
+            # (one entry per data point)
+            try:
+                confidence_metrics = cls._simulate_confidence_metrics(
+                    ndvi_values=ndvi_values,
+                    ndvi_stds=ndvi_stds,
+                    allometric_params=allometric_params,
+                    n_iterations=cls.MONTE_CARLO_ITERATIONS,
+                )
+            except MonteCarloSimulationError as e:
+                logger.error(f"Monte Carlo simulation failed: {str(e)}")
+                raise
 
-                # Extract values (using median as central estimate)
-                agb_tonnes_ha = confidence_metrics["median"]
-                agb_tonnes_ha = max(0.0, agb_tonnes_ha)  # Ensure non-negative
-                carbon_tonnes_ha = agb_tonnes_ha * cls.CARBON_FRACTION
-                co2_tonnes_ha = carbon_tonnes_ha * cls.CO2_TO_CARBON_RATIO
+            # Extract values (using median as central estimate)
+            agb_values = np.maximum(confidence_metrics["median"], 0.0)
+            carbon_values = agb_values * cls.CARBON_FRACTION
+            confidence_scores = confidence_metrics["confidence_score"]
+            std_devs = confidence_metrics["std_dev"]
 
-                total_agb_tonnes = agb_tonnes_ha * area_ha
-                total_carbon_tonnes = carbon_tonnes_ha * area_ha
-                total_co2_tonnes = co2_tonnes_ha * area_ha
+            data_points = []
+            for i, point in enumerate(ndvi_data):
+                agb_tonnes_ha = float(agb_values[i])
+                carbon_tonnes_ha = float(carbon_values[i])
+                co2_tonnes_ha = carbon_tonnes_ha * cls.CO2_TO_CARBON_RATIO
+                confidence_score = float(confidence_scores[i])
 
                 data_point = {
                     "date": point["date"],
-                    "ndvi": round(ndvi, 6),
+                    "ndvi": round(float(ndvi_values[i]), 6),
                     "agb_tonnes_ha": round(agb_tonnes_ha, 4),
-                    "agb_total_tonnes": round(total_agb_tonnes, 4),
+                    "agb_total_tonnes": round(agb_tonnes_ha * area_ha, 4),
                     "carbon_tonnes_ha": round(carbon_tonnes_ha, 4),
-                    "carbon_total_tonnes": round(total_carbon_tonnes, 4),
+                    "carbon_total_tonnes": round(carbon_tonnes_ha * area_ha, 4),
                     "co2_tonnes_ha": round(co2_tonnes_ha, 4),
-                    "co2_total_tonnes": round(total_co2_tonnes, 4),
-                    "confidence_score": round(confidence_metrics["confidence_score"], 1),
-                    "ci_lower": round(confidence_metrics["ci_lower"], 4),
-                    "ci_upper": round(confidence_metrics["ci_upper"], 4),
-                    "std_dev": round(confidence_metrics["std_dev"], 4),
+                    "co2_total_tonnes": round(co2_tonnes_ha * area_ha, 4),
+                    "confidence_score": round(confidence_score, 1),
+                    "ci_lower": round(float(confidence_metrics["ci_lower"][i]), 4),
+                    "ci_upper": round(float(confidence_metrics["ci_upper"][i]), 4),
+                    "std_dev": round(float(std_devs[i]), 4),
                 }
 
                 data_points.append(data_point)
-                agb_values.append(agb_tonnes_ha)
-                carbon_values.append(carbon_tonnes_ha)
-                confidence_scores.append(confidence_metrics["confidence_score"])
-                std_devs.append(confidence_metrics["std_dev"])
 
                 # Log warning for low confidence
-                if confidence_metrics["confidence_score"] < 50:
+                if confidence_score < 50:
                     logger.warning(
-                        f"Low confidence score ({confidence_metrics['confidence_score']:.1f}) "
-                        f"for NDVI={ndvi} on {point['date']}"
+                        f"Low confidence score ({confidence_score:.1f}) "
+                        f"for NDVI={point['ndvi']} on {point['date']}"
                     )
 
             # Calculate aggregated statistics
-            if not agb_values:
+            if not data_points:
                 raise CarbonCalculationError("No valid NDVI data for calculation")
 
-            mean_agb_ha = sum(agb_values) / len(agb_values)
-            mean_carbon_ha = sum(carbon_values) / len(carbon_values)
+            mean_agb_ha = float(agb_values.mean())
+            mean_carbon_ha = float(carbon_values.mean())
             mean_agb_total = mean_agb_ha * area_ha
             mean_carbon_total = mean_carbon_ha * area_ha
             mean_co2_total = mean_carbon_total * cls.CO2_TO_CARBON_RATIO
 
-            mean_confidence_score = sum(confidence_scores) / len(confidence_scores)
-            overall_std_dev = sum(std_devs) / len(std_devs)
+            mean_confidence_score = float(confidence_scores.mean())
+            overall_std_dev = float(std_devs.mean())
 
             # Build metadata
             assumptions_list = [
@@ -379,15 +470,29 @@ class CarbonService:
                 "end_date": end_date.isoformat(),
                 "area_ha": area_ha,
                 "data_points": data_points,
+                "arrays": {
+                    "dates": np.array(
+                        [point["date"] for point in ndvi_data], dtype="datetime64[D]"
+                    ),
+                    "ndvi": ndvi_values,
+                    "agb_tonnes_ha": agb_values,
+                    "carbon_tonnes_ha": carbon_values,
+                    "co2_tonnes_ha": carbon_values * cls.CO2_TO_CARBON_RATIO,
+                    "carbon_tonnes": carbon_values * area_ha,
+                    "confidence_score": confidence_scores,
+                    "ci_lower": confidence_metrics["ci_lower"],
+                    "ci_upper": confidence_metrics["ci_upper"],
+                    "std_dev": std_devs,
+                },
                 "statistics": {
                     "mean_agb_tonnes_ha": round(mean_agb_ha, 4),
                     "total_agb_tonnes": round(mean_agb_total, 4),
                     "mean_carbon_tonnes_ha": round(mean_carbon_ha, 4),
                     "total_carbon_tonnes": round(mean_carbon_total, 4),
                     "total_co2_tonnes": round(mean_co2_total, 4),
-                    "min_ndvi": round(min(p["ndvi"] for p in ndvi_data), 4),
-                    "max_ndvi": round(max(p["ndvi"] for p in ndvi_data), 4),
-                    "mean_ndvi": round(sum(p["ndvi"] for p in ndvi_data) / len(ndvi_data), 4),
+                    "min_ndvi": round(float(ndvi_values.min()), 4),
+                    "max_ndvi": round(float(ndvi_values.max()), 4),
+                    "mean_ndvi": round(float(ndvi_values.mean()), 4),
                     "mean_confidence_score": round(mean_confidence_score, 1),
                     "overall_std_dev": round(overall_std_dev, 4),
                 },
@@ -468,20 +573,105 @@ class CarbonService:
         ndvi_std: float,
         allometric_params: dict,
         n_iterations: int = 10000,
+        tol: Optional[float] = None,
+        chunk: int = 1000,
     ) -> np.ndarray:
         """
         Run Monte Carlo simulation for carbon estimation uncertainty.
 
         Samples from parameter distributions and calculates AGB for each iteration.
 
+        With tol set, samples are drawn in chunks and the run stops early once
+        the standard error of the running mean (tracked with Welford's
+        algorithm) falls below tol * |mean|. At least MIN_CONVERGENCE_CHUNKS
+        chunks are drawn so the tails behind the CI percentiles are populated.
+
         Args:
             ndvi_value: NDVI value
             ndvi_std: Standard deviation of NDVI uncertainty
             allometric_params: Dict with a_mean, a_std, b_mean, b_std
-            n_iterations: Number of Monte Carlo iterations
+            n_iterations: Number of Monte Carlo iterations (upper bound if tol is set)
+            tol: Optional relative standard error at which to stop early
+            chunk: Iterations drawn per convergence check
+
+        Returns:
+            Numpy array of shape (n_used,) with AGB values (tonnes/ha), where
+            n_used == n_iterations unless the run converged early
+
+        Raises:
+            MonteCarloSimulationError: If simulation fails or produces invalid values
+        """
+        ndvi_values = np.array([ndvi_value], dtype=float)
+        ndvi_stds = np.array([ndvi_std], dtype=float)
+
+        if tol is None:
+            return cls._run_monte_carlo_batch(
+                ndvi_values=ndvi_values,
+                ndvi_stds=ndvi_stds,
+                allometric_params=allometric_params,
+                n_iterations=n_iterations,
+            )[0]
+
+        if chunk <= 0:
+            raise MonteCarloSimulationError("Convergence chunk size must be positive")
+
+        samples = []
+        count, mean, m2 = 0, 0.0, 0.0
+        while count < n_iterations:
+            block = cls._run_monte_carlo_batch(
+                ndvi_values=ndvi_values,
+                ndvi_stds=ndvi_stds,
+                allometric_params=allometric_params,
+                n_iterations=min(chunk, n_iterations - count),
+            )[0]
+            samples.append(block)
+
+            # Welford update, merged one chunk at a time
+            block_mean = float(block.mean())
+            block_m2 = float(np.square(block - block_mean).sum())
+            delta = block_mean - mean
+            total = count + block.size
+            mean += delta * block.size / total
+            m2 += block_m2 + delta * delta * count * block.size / total
+            count = total
+
+            if len(samples) >= cls.MIN_CONVERGENCE_CHUNKS and mean != 0:
+                stderr = math.sqrt(m2 / (count - 1) / count)
+                if stderr / abs(mean) < tol:
+                    break
+
+        return np.concatenate(samples)
+
+    @classmethod
+    def _run_monte_carlo_batch(
+        cls,
+        ndvi_values: np.ndarray,
+        ndvi_stds: np.ndarray,
+        allometric_params: dict,
+        n_iterations: int = 10000,
+        rng: Optional[np.random.Generator] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Run Monte Carlo simulations for several NDVI values in one pass.
+
+        Draws an (n_points, n_iterations) sample matrix per parameter and
+        evaluates the allometric equation with a single broadcast. Samples
+        are drawn with standard_normal into this thread's scratch arrays and
+        scaled in place, which gives the same values as rng.normal without
+        allocating three new matrices per call.
+
+        Args:
+            ndvi_values: Array of NDVI values, shape (n_points,)
+            ndvi_stds: Array of NDVI standard deviations, shape (n_points,)
+            allometric_params: Dict with a_mean, a_std, b_mean, b_std
+            n_iterations: Number of Monte Carlo iterations per point
+            rng: Generator to draw from (defaults to the module generator)
+            out: Array of shape (n_points, n_iterations) to write AGB into;
+                a new array is allocated when omitted
 
         Returns:
-            Numpy array of shape (n_iterations,) with AGB values (tonnes/ha)
+            Numpy array of shape (n_points, n_iterations) with AGB values (tonnes/ha)
 
         Raises:
             MonteCarloSimulationError: If simulation fails or produces invalid values
@@ -492,27 +682,36 @@ class CarbonService:
             b_mean = allometric_params["b_mean"]
             b_std = allometric_params["b_std"]
 
-            # Sample parameters from distributions
-            a_samples = np.random.normal(a_mean, a_std, n_iterations)
-            b_samples = np.random.normal(b_mean, b_std, n_iterations)
-            ndvi_samples = np.random.normal(ndvi_value, ndvi_std, n_iterations)
+            if rng is None:
+                rng = _rng
+            shape = (len(ndvi_values), n_iterations)
+
+            if a_std < 0 or b_std < 0 or np.any(np.asarray(ndvi_stds) < 0):
+                raise MonteCarloSimulationError(
+                    "Standard deviations must be non-negative"
+                )
+
+            # Sample all points and iterations at once from the parameter
+            # distributions (loc + scale * z, as rng.normal computes it)
+            a_samples, b_samples, ndvi_samples, _ = _mc_buffers(shape)
+            rng.standard_normal(out=a_samples)
+            a_samples *= a_std
+            a_samples += a_mean
+            rng.standard_normal(out=b_samples)
+            b_samples *= b_std
+            b_samples += b_mean
+            rng.standard_normal(out=ndvi_samples)
+            ndvi_samples *= np.asarray(ndvi_stds, dtype=float)[:, None]
+            ndvi_samples += np.asarray(ndvi_values, dtype=float)[:, None]
 
             # Clip NDVI to valid range
-            ndvi_samples = np.clip(ndvi_samples, -1.0, 1.0)
+            np.clip(ndvi_samples, -1.0, 1.0, out=ndvi_samples)
 
             # Calculate AGB: AGB = a * NDVI^b
-            # Handle case where NDVI might be negative or zero
-            agb_results = np.where(
-                ndvi_samples > 0,
-                a_samples * np.power(ndvi_samples, b_samples),
-                0.0,
-            )
-
-            # Ensure non-negative values
-            agb_results = np.clip(agb_results, 0.0, np.inf)
+            agb_results = _allometric_biomass(a_samples, ndvi_samples, b_samples, out=out)
 
             # Validate results
-            if np.isnan(agb_results).any() or np.isinf(agb_results).any():
+            if not np.isfinite(agb_results).all():
                 raise MonteCarloSimulationError("Simulation produced NaN or Inf values")
 
             return agb_results
@@ -522,6 +721,58 @@ class CarbonService:
         except Exception as e:
             raise MonteCarloSimulationError(f"Simulation failed: {str(e)}")
 
+    @classmethod
+    def _simulate_confidence_metrics(
+        cls,
+        ndvi_values: np.ndarray,
+        ndvi_stds: np.ndarray,
+        allometric_params: dict,
+        n_iterations: int = 10000,
+    ) -> dict:
+        """
+        Simulate every data point and reduce each to its confidence metrics.
+
+        Points are processed in blocks of MONTE_CARLO_BLOCK_ROWS so the full
+        (n_points, n_iterations) sample matrix is never held at once. When
+        there is more than one block, blocks run on worker threads (NumPy
+        releases the GIL in its kernels) on the shared _mc_block_executor,
+        each drawing from its own child generator spawned from the module
+        generator.
+
+        Returns:
+            dict with the same keys as _calculate_confidence_metrics_batch,
+            each an array of shape (n_points,)
+        """
+        n_points = len(ndvi_values)
+        starts = range(0, n_points, cls.MONTE_CARLO_BLOCK_ROWS)
+
+        def run_block(start: int, rng: np.random.Generator) -> dict:
+            stop = start + cls.MONTE_CARLO_BLOCK_ROWS
+            block_values = ndvi_values[start:stop]
+            # The block is reduced to metrics straight away, so AGB can go
+            # into this thread's scratch space as well
+            mc_results = cls._run_monte_carlo_batch(
+                ndvi_values=block_values,
+                ndvi_stds=ndvi_stds[start:stop],
+                allometric_params=allometric_params,
+                n_iterations=n_iterations,
+                rng=rng,
+                out=_mc_buffers((len(block_values), n_iterations))[3],
+            )
+            return cls._calculate_confidence_metrics_batch(mc_results)
+
+        if len(starts) <= 1:
+            return run_block(0, _rng)
+
+        with _rng_lock:
+            rngs = _rng.spawn(len(starts))
+        blocks = list(_mc_block_executor.map(run_block, starts, rngs))
+
+        return {
+            key: np.concatenate([block[key] for block in blocks])
+            for key in blocks[0]
+        }
+
     @classmethod
     def _calculate_confidence_metrics(cls, mc_results: np.ndarray) -> dict:
         """
@@ -539,9 +790,10 @@ class CarbonService:
                 - confidence_score: 0-100 score (higher = lower uncertainty)
         """
         try:
-            median = np.percentile(mc_results, 50)
-            ci_lower = np.percentile(mc_results, cls.CONFIDENCE_INTERVAL_PERCENTILES[0])
-            ci_upper = np.percentile(mc_results, cls.CONFIDENCE_INTERVAL_PERCENTILES[1])
+            lower_pct, upper_pct = cls.CONFIDENCE_INTERVAL_PERCENTILES
+            ci_lower, median, ci_upper = _percentiles(
+                mc_results, (lower_pct, 50, upper_pct)
+            )
             std_dev = np.std(mc_results)
 
             # Calculate confidence score based on coefficient of variation
@@ -568,6 +820,48 @@ class CarbonService:
                 f"Failed to calculate confidence metrics: {str(e)}"
             )
 
+    @classmethod
+    def _calculate_confidence_metrics_batch(cls, mc_results: np.ndarray) -> dict:
+        """
+        Calculate confidence metrics for each row of a batched Monte Carlo result.
+
+        Args:
+            mc_results: Numpy array of shape (n_points, n_iterations)
+
+        Returns:
+            dict with the same keys as _calculate_confidence_metrics, each an
+            array of shape (n_points,)
+        """
+        try:
+            lower_pct, upper_pct = cls.CONFIDENCE_INTERVAL_PERCENTILES
+            ci_lower, median, ci_upper = _percentiles(
+                mc_results, (lower_pct, 50, upper_pct)
+            )
+            std_dev = np.std(mc_results, axis=1)
+
+            # Same coefficient-of-variation score as the single-point version;
+            # rows with a non-positive median get the maximum score
+            positive = median > 0
+            cv = np.divide(std_dev, median, out=np.zeros_like(std_dev), where=positive)
+            confidence_score = np.where(
+                positive,
+                np.clip(100 * (1 - cv), cls.MIN_CONFIDENCE_SCORE, cls.MAX_CONFIDENCE_SCORE),
+                cls.MAX_CONFIDENCE_SCORE,
+            )
+
+            return {
+                "median": median,
+                "ci_lower": ci_lower,
+                "ci_upper": ci_upper,
+                "std_dev": std_dev,
+                "confidence_score": confidence_score,
+            }
+
+        except Exception as e:
+            raise MonteCarloSimulationError(
+                f"Failed to calculate confidence metrics: {str(e)}"
+            )
+
     @classmethod
     def _validate_lulc_data(cls, lulc_data: dict) -> None:
         """
@@ -653,12 +947,14 @@ class CarbonService:
             lulc_data,
         )
 
-    @classmethod
-    def _simple_carbon_estimate(cls, area_hectares: float) -> float:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _simple_carbon_estimate(area_hectares: float) -> float:
         """
         Simple carbon estimation for cases where detailed data is unavailable.
 
         Uses conservative default estimate of 120 tonnes/ha (from phase2 baseline).
+        Pure in its argument, so results are memoized per farm area.
 
         Args:
             area_hectares: Farm area in hectares
@@ -28,13 +28,16 @@ class EarthEngineManager:
     """
 
     _instance: Optional["EarthEngineManager"] = None
+    # Guards instance creation only; kept separate from _lock so callers
+    # never wait behind a slow (retrying) Earth Engine initialization.
+    _instance_lock: threading.Lock = threading.Lock()
     _lock: threading.Lock = threading.Lock()
     _initialized: bool = False
 
     def __new__(cls) -> "EarthEngineManager":
-        """Implement singleton pattern with thread safety."""
+        """Implement singleton pattern with double-checked locking."""
         if cls._instance is None:
-            with cls._lock:
+            with cls._instance_lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
         return cls._instance
@@ -42,6 +45,9 @@ class EarthEngineManager:
     @classmethod
     def get_instance(cls) -> "EarthEngineManager":
         """Get or create singleton instance."""
+        instance = cls._instance
+        if instance is not None:
+            return instance
         return cls()
 
     def initialize(self) -> None:
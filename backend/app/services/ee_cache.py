@@ -0,0 +1,110 @@
+"""On-disk cache for Earth Engine results.
+
+Each Earth Engine query is a synchronous round-trip to Google's servers.
+Results for an identical request (e.g. dataset, geometry and date range for
+time series, or satellite and day for health checks) are stored in a
+diskcache.Cache so repeat requests skip the network entirely.
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Callable, Hashable, List, Optional, TypeVar
+
+import diskcache
+import orjson
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_cache: Optional[diskcache.Cache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> diskcache.Cache:
+    """Return the shared cache, opening it lazily at settings.EE_CACHE_DIR."""
+    global _cache
+    if _cache is None or _cache.directory != settings.EE_CACHE_DIR:
+        with _cache_lock:
+            if _cache is None or _cache.directory != settings.EE_CACHE_DIR:
+                _cache = diskcache.Cache(settings.EE_CACHE_DIR)
+    return _cache
+
+
+def geojson_key(farm_geojson: dict) -> str:
+    """Stable 128-bit hash of a GeoJSON object, independent of key order."""
+    payload = orjson.dumps(farm_geojson, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def cached_call(
+    key: Hashable,
+    compute: Callable[[], T],
+    expire: int,
+    should_cache: Callable[[T], bool] = lambda result: True,
+    force: bool = False,
+) -> T:
+    """
+    Return compute() through the disk cache under key.
+
+    Args:
+        key: Cache key; must be picklable
+        compute: Synchronous Earth Engine computation to run on a cache miss
+        expire: Seconds before a stored result expires
+        should_cache: Predicate deciding whether a fresh result is stored
+        force: Skip the lookup and recompute, overwriting any stored result
+
+    Returns:
+        The cached or freshly computed result
+    """
+    if not settings.EE_CACHE_ENABLED:
+        return compute()
+
+    cache = get_cache()
+    if not force:
+        result = cache.get(key)
+        if result is not None:
+            logger.debug(f"Earth Engine cache hit for {key!r}")
+            return result
+
+    result = compute()
+    if result is not None and should_cache(result):
+        cache.set(key, result, expire=expire)
+    return result
+
+
+def cached_time_series(
+    dataset: str,
+    compute: Callable[[dict, str, str], List[dict]],
+    farm_geojson: dict,
+    start_date: str,
+    end_date: str,
+) -> List[dict]:
+    """
+    Return compute(farm_geojson, start_date, end_date) through the disk cache.
+
+    Empty results are not cached so that a date window whose imagery has not
+    been ingested yet is queried again next time.
+
+    Args:
+        dataset: Name of the dataset, used as part of the cache key
+        compute: Synchronous Earth Engine computation to run on a cache miss
+        farm_geojson: GeoJSON geometry of farm boundary
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+
+    Returns:
+        The cached or freshly computed time series
+    """
+    if not settings.EE_CACHE_ENABLED:
+        return compute(farm_geojson, start_date, end_date)
+
+    return cached_call(
+        (dataset, geojson_key(farm_geojson), start_date, end_date),
+        lambda: compute(farm_geojson, start_date, end_date),
+        expire=settings.EE_CACHE_TTL_SECONDS,
+        should_cache=bool,
+    )
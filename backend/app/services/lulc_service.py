@@ -2,10 +2,10 @@
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import ee
+import numpy as np
 
 from app.core.config import settings
 from app.services.earth_engine import EarthEngineManager
@@ -15,21 +15,22 @@ from app.services.exceptions import (
     EarthEngineError,
     EarthEngineQuotaError,
 )
+from app.utils.validation import SUPPORTED_GEOMETRY_TYPES, validate_date_range
 
 logger = logging.getLogger(__name__)
 
-# Dynamic World class mapping (ID to name)
-LULC_CLASS_NAMES = {
-    0: "Water",
-    1: "Trees",
-    2: "Grass",
-    3: "Flooded Vegetation",
-    4: "Crops",
-    5: "Shrub/Scrub",
-    6: "Built Area",
-    7: "Bare Ground",
-    8: "Snow/Ice",
-}
+# Dynamic World class names, indexed by class ID
+LULC_CLASS_NAMES: Tuple[str, ...] = (
+    "Water",
+    "Trees",
+    "Grass",
+    "Flooded Vegetation",
+    "Crops",
+    "Shrub/Scrub",
+    "Built Area",
+    "Bare Ground",
+    "Snow/Ice",
+)
 
 
 class LULCService:
@@ -198,31 +199,43 @@ class LULCService:
         end_date: str,
     ) -> Dict:
         """Format raw class areas into API response."""
-        total_area_ha = sum(class_areas.values())
-
-        # Build class list with percentages
-        classes = []
-        dominant_class = None
-        max_area = 0
-
-        for class_id, area_ha in sorted(class_areas.items()):
-            percentage = (area_ha / total_area_ha * 100) if total_area_ha > 0 else 0
-
-            class_name = LULC_CLASS_NAMES.get(class_id, f"Unknown ({class_id})")
+        ordered = sorted(class_areas.items())
+        class_ids = np.fromiter((k for k, _ in ordered), dtype=np.int64, count=len(ordered))
+        areas = np.fromiter((v for _, v in ordered), dtype=np.float64, count=len(ordered))
 
-            classes.append(
-                {
-                    "id": class_id,
-                    "name": class_name,
-                    "area_ha": round(area_ha, 2),
-                    "percentage": round(percentage, 2),
-                }
+        total_area_ha = float(areas.sum())
+        if total_area_ha > 0:
+            percentages = areas / total_area_ha * 100
+        else:
+            percentages = np.zeros_like(areas)
+
+        names = [
+            LULC_CLASS_NAMES[class_id]
+            if 0 <= class_id < len(LULC_CLASS_NAMES)
+            else f"Unknown ({class_id})"
+            for class_id in class_ids.tolist()
+        ]
+        classes = [
+            {
+                "id": class_id,
+                "name": name,
+                "area_ha": area_ha,
+                "percentage": percentage,
+            }
+            for class_id, name, area_ha, percentage in zip(
+                class_ids.tolist(),
+                names,
+                np.round(areas, 2).tolist(),
+                np.round(percentages, 2).tolist(),
             )
+        ]
 
-            # Track dominant class
-            if area_ha > max_area:
-                max_area = area_ha
-                dominant_class = class_name
+        # argmax returns the first maximum, matching the lowest-id tie-break
+        dominant_class = None
+        if areas.size:
+            dominant_idx = int(areas.argmax())
+            if areas[dominant_idx] > 0:
+                dominant_class = names[dominant_idx]
 
         return {
             "total_area_ha": round(total_area_ha, 2),
@@ -243,12 +256,7 @@ class LULCService:
                     "GeoJSON geometry must contain 'type' and 'coordinates'"
                 )
 
-            if geometry["type"] not in [
-                "Point",
-                "Polygon",
-                "MultiPolygon",
-                "LineString",
-            ]:
+            if geometry["type"] not in SUPPORTED_GEOMETRY_TYPES:
                 raise InvalidGeometryError(
                     f"Unsupported geometry type: {geometry['type']}"
                 )
@@ -259,28 +267,18 @@ class LULCService:
         except (KeyError, TypeError) as e:
             raise InvalidGeometryError(f"Invalid GeoJSON structure: {str(e)}") from e
 
-    def _validate_date_range(self, start_date: str, end_date: str) -> None:
-        """Validate date format and range."""
-        try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
-
-            if start >= end:
-                raise InvalidDateRangeError(
-                    f"Start date must be before end date: {start_date} >= {end_date}"
-                )
-
-            # Check if range is not too large (max 5 years)
-            days_diff = (end - start).days
-            if days_diff > 365 * 5:
-                raise InvalidDateRangeError(
-                    f"Date range too large: {days_diff} days (max 5 years)"
-                )
+    @staticmethod
+    def _validate_date_range(start_date: str, end_date: str) -> None:
+        """
+        Validate date format and range (shared, memoized validator).
 
+        Raises:
+            InvalidDateRangeError: If dates are invalid
+        """
+        try:
+            validate_date_range(start_date, end_date)
         except ValueError as e:
-            raise InvalidDateRangeError(
-                f"Invalid date format. Use YYYY-MM-DD: {str(e)}"
-            ) from e
+            raise InvalidDateRangeError(str(e)) from e
 
     def _validate_geometry_size(self, geojson: dict) -> None:
         """
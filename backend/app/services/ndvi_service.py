@@ -2,22 +2,85 @@
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import ee
+import numpy as np
 
 from app.core.config import settings
 from app.services.earth_engine import EarthEngineManager
+from app.services.ee_cache import cached_time_series
 from app.services.exceptions import (
     InvalidGeometryError,
     InvalidDateRangeError,
     EarthEngineError,
     EarthEngineQuotaError,
 )
+from app.utils.validation import SUPPORTED_GEOMETRY_TYPES, validate_date_range
 
 logger = logging.getLogger(__name__)
 
+# Plausible bounds for validated environmental values (inclusive)
+TEMPERATURE_RANGE_C = (-90.0, 60.0)
+HUMIDITY_RANGE_PERCENT = (0.0, 100.0)
+
+# Maximum scene cloud cover accepted for Sentinel-2 NDVI
+MAX_CLOUDY_PIXEL_PERCENTAGE = 20
+
+
+@lru_cache(maxsize=None)
+def _cloud_filter() -> ee.Filter:
+    """
+    Sentinel-2 scene cloud cover filter, built once and shared.
+
+    Earth Engine objects are immutable, but they can only be constructed
+    after ee.Initialize(), so this is built lazily on first use rather
+    than at import time.
+    """
+    return ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", MAX_CLOUDY_PIXEL_PERCENTAGE)
+
+
+@lru_cache(maxsize=None)
+def _reducer(name: str) -> ee.Reducer:
+    """Shared ee.Reducer instance by name (e.g. "mean", "stdDev"), built lazily."""
+    return getattr(ee.Reducer, name)()
+
+
+def _features_to_series(features: List[dict]) -> List[dict]:
+    """
+    Convert reduced NDVI features into a date-sorted time series.
+
+    Values are pulled into arrays so the sort runs in NumPy. Null NDVI
+    values are normally filtered out by Earth Engine already; any that
+    remain are dropped here as well. A missing or null std is reported
+    as 0 so it cannot reach the Monte Carlo draws as NaN.
+
+    Args:
+        features: Feature dicts from the FeatureCollection getInfo() payload
+
+    Returns:
+        List of dicts with keys: date (YYYY-MM-DD), ndvi (float), std (float)
+    """
+    props = [feature.get("properties", {}) for feature in features]
+    # dtype=float turns missing (None) values into NaN
+    ndvi = np.array([p.get("ndvi") for p in props], dtype=np.float64)
+    std = np.array(
+        [0.0 if p.get("std") is None else p["std"] for p in props], dtype=np.float64
+    )
+    dates = np.array([p.get("date") for p in props], dtype=object)
+
+    keep = np.flatnonzero(~np.isnan(ndvi))
+    # ISO dates sort lexicographically; stable to match sorted()
+    keep = keep[np.argsort(dates[keep].astype(str), kind="stable")]
+
+    return [
+        {"date": d, "ndvi": v, "std": s}
+        for d, v, s in zip(
+            dates[keep].tolist(), ndvi[keep].tolist(), std[keep].tolist()
+        )
+    ]
+
 
 class NDVIService:
     """
@@ -65,6 +128,8 @@ class NDVIService:
         # Run synchronous GEE computation in thread pool
         try:
             result = await asyncio.to_thread(
+                cached_time_series,
+                "ndvi",
                 self._compute_ndvi_sync,
                 farm_geojson,
                 start_date,
@@ -96,7 +161,7 @@ class NDVIService:
                 ee.ImageCollection("COPERNICUS/S2_SR")
                 .filterBounds(geometry)
                 .filterDate(start_date, end_date)
-                .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", 20))
+                .filter(_cloud_filter())
             )
 
             # Check if collection is empty
@@ -126,13 +191,13 @@ class NDVIService:
                                 "YYYY-MM-dd"
                             ),
                             "ndvi": img.reduceRegion(
-                                reducer=ee.Reducer.mean(),
+                                reducer=_reducer("mean"),
                                 geometry=geometry,
                                 scale=10,
                                 maxPixels=1e9,
                             ).get("NDVI"),
                             "std": img.reduceRegion(
-                                reducer=ee.Reducer.stdDev(),
+                                reducer=_reducer("stdDev"),
                                 geometry=geometry,
                                 scale=10,
                                 maxPixels=1e9,
@@ -140,29 +205,21 @@ class NDVIService:
                         },
                     )
                 )
+            ).filter(
+                # Drop fully masked scenes server-side so they are never
+                # serialized into the getInfo() payload
+                ee.Filter.notNull(["ndvi"])
             )
 
             # Extract data
             data = ndvi_stats.getInfo()
             features = data.get("features", [])
 
-            # Format results, filtering out null values
-            results = []
-            for feature in features:
-                props = feature.get("properties", {})
-                ndvi_value = props.get("ndvi")
-
-                if ndvi_value is not None:
-                    results.append(
-                        {
-                            "date": props.get("date"),
-                            "ndvi": float(ndvi_value),
-                            "std": float(props.get("std", 0)),
-                        }
-                    )
+            # Format results (nulls are already filtered out by Earth Engine)
+            results = _features_to_series(features)
 
             logger.info(f"Successfully calculated NDVI for {len(results)} dates")
-            return sorted(results, key=lambda x: x["date"])
+            return results
 
         except ee.EEException as e:
             error_msg = str(e).lower()
@@ -187,12 +244,7 @@ class NDVIService:
                     "GeoJSON geometry must contain 'type' and 'coordinates'"
                 )
 
-            if geometry["type"] not in [
-                "Point",
-                "Polygon",
-                "MultiPolygon",
-                "LineString",
-            ]:
+            if geometry["type"] not in SUPPORTED_GEOMETRY_TYPES:
                 raise InvalidGeometryError(
                     f"Unsupported geometry type: {geometry['type']}"
                 )
@@ -203,33 +255,18 @@ class NDVIService:
         except (KeyError, TypeError) as e:
             raise InvalidGeometryError(f"Invalid GeoJSON structure: {str(e)}") from e
 
-    def _validate_date_range(self, start_date: str, end_date: str) -> None:
+    @staticmethod
+    def _validate_date_range(start_date: str, end_date: str) -> None:
         """
-        Validate date format and range.
+        Validate date format and range (shared, memoized validator).
 
         Raises:
             InvalidDateRangeError: If dates are invalid
         """
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
-
-            if start >= end:
-                raise InvalidDateRangeError(
-                    f"Start date must be before end date: {start_date} >= {end_date}"
-                )
-
-            # Check if range is not too large (max 5 years)
-            days_diff = (end - start).days
-            if days_diff > 365 * 5:
-                raise InvalidDateRangeError(
-                    f"Date range too large: {days_diff} days (max 5 years)"
-                )
-
+            validate_date_range(start_date, end_date)
         except ValueError as e:
-            raise InvalidDateRangeError(
-                f"Invalid date format. Use YYYY-MM-DD: {str(e)}"
-            ) from e
+            raise InvalidDateRangeError(str(e)) from e
 
     @staticmethod
     def _geojson_to_ee_geometry(geojson: dict) -> ee.Geometry:
@@ -277,17 +314,14 @@ class NDVIService:
 
         self.ee_manager.initialize()
 
-        try:
-            result = await asyncio.to_thread(
-                self._compute_temperature_sync,
-                farm_geojson,
-                start_date,
-                end_date,
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Temperature calculation failed: {e}")
-            raise
+        return await self._run_cached_series(
+            "temperature",
+            "Temperature",
+            self._compute_temperature_sync,
+            farm_geojson,
+            start_date,
+            end_date,
+        )
 
     def _compute_temperature_sync(
         self,
@@ -326,25 +360,25 @@ class NDVIService:
                     {
                         "date": ee.Date(img.get("system:time_start")).format("YYYY-MM-dd"),
                         "temperature_celsius": temp_celsius.reduceRegion(
-                            reducer=ee.Reducer.mean(),
+                            reducer=_reducer("mean"),
                             geometry=geometry,
                             scale=9000,
                             maxPixels=1e9,
                         ).get("temperature_celsius"),
                         "std": temp_celsius.reduceRegion(
-                            reducer=ee.Reducer.stdDev(),
+                            reducer=_reducer("stdDev"),
                             geometry=geometry,
                             scale=9000,
                             maxPixels=1e9,
                         ).get("temperature_celsius"),
                         "min_temp": temp_celsius.reduceRegion(
-                            reducer=ee.Reducer.min(),
+                            reducer=_reducer("min"),
                             geometry=geometry,
                             scale=9000,
                             maxPixels=1e9,
                         ).get("temperature_celsius"),
                         "max_temp": temp_celsius.reduceRegion(
-                            reducer=ee.Reducer.max(),
+                            reducer=_reducer("max"),
                             geometry=geometry,
                             scale=9000,
                             maxPixels=1e9,
@@ -376,26 +410,37 @@ class NDVIService:
                     )
 
             # Calculate daily statistics
+            dates = sorted(daily_temps.keys())
+            avg_temps = np.array(
+                [
+                    sum(t["temp"] for t in daily_temps[date]) / len(daily_temps[date])
+                    for date in dates
+                ],
+                dtype=float,
+            )
+
+            # Validate all daily means at once; implausible days are dropped
+            valid = self._environmental_range_mask(avg_temps, *TEMPERATURE_RANGE_C)
+            self._log_dropped_days(valid, "temperature", TEMPERATURE_RANGE_C)
+
             results = []
-            for date in sorted(daily_temps.keys()):
+            for date, avg_temp, is_valid in zip(dates, avg_temps.tolist(), valid.tolist()):
+                if not is_valid:
+                    continue
                 temps = daily_temps[date]
-                if temps:
-                    avg_temp = sum(t["temp"] for t in temps) / len(temps)
-                    avg_std = sum(t["std"] for t in temps) / len(temps)
-                    min_temp = min(t["min"] for t in temps)
-                    max_temp = max(t["max"] for t in temps)
+                avg_std = sum(t["std"] for t in temps) / len(temps)
+                min_temp = min(t["min"] for t in temps)
+                max_temp = max(t["max"] for t in temps)
 
-                    self._validate_environmental_data(avg_temp)
-
-                    results.append(
-                        {
-                            "date": date,
-                            "temperature_celsius": round(avg_temp, 2),
-                            "std": round(avg_std, 2),
-                            "min_temp": round(min_temp, 2),
-                            "max_temp": round(max_temp, 2),
-                        }
-                    )
+                results.append(
+                    {
+                        "date": date,
+                        "temperature_celsius": round(avg_temp, 2),
+                        "std": round(avg_std, 2),
+                        "min_temp": round(min_temp, 2),
+                        "max_temp": round(max_temp, 2),
+                    }
+                )
 
             logger.info(f"Successfully calculated temperature for {len(results)} dates")
             return results
@@ -434,17 +479,14 @@ class NDVIService:
 
         self.ee_manager.initialize()
 
-        try:
-            result = await asyncio.to_thread(
-                self._compute_humidity_sync,
-                farm_geojson,
-                start_date,
-                end_date,
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Humidity calculation failed: {e}")
-            raise
+        return await self._run_cached_series(
+            "humidity",
+            "Humidity",
+            self._compute_humidity_sync,
+            farm_geojson,
+            start_date,
+            end_date,
+        )
 
     def _compute_humidity_sync(
         self,
@@ -482,13 +524,13 @@ class NDVIService:
                     {
                         "date": ee.Date(img.get("system:time_start")).format("YYYY-MM-dd"),
                         "humidity_percent": rh.reduceRegion(
-                            reducer=ee.Reducer.mean(),
+                            reducer=_reducer("mean"),
                             geometry=geometry,
                             scale=9000,
                             maxPixels=1e9,
                         ).get("RH"),
                         "std": rh.reduceRegion(
-                            reducer=ee.Reducer.stdDev(),
+                            reducer=_reducer("stdDev"),
                             geometry=geometry,
                             scale=9000,
                             maxPixels=1e9,
@@ -518,22 +560,36 @@ class NDVIService:
                     )
 
             # Calculate daily statistics
+            dates = sorted(daily_humidity.keys())
+            avg_humidities = np.array(
+                [
+                    sum(h["humidity"] for h in daily_humidity[date])
+                    / len(daily_humidity[date])
+                    for date in dates
+                ],
+                dtype=float,
+            )
+
+            # Validate humidity in range [0, 100]; implausible days are dropped
+            valid = self._environmental_range_mask(avg_humidities, *HUMIDITY_RANGE_PERCENT)
+            self._log_dropped_days(valid, "humidity", HUMIDITY_RANGE_PERCENT)
+
             results = []
-            for date in sorted(daily_humidity.keys()):
+            for date, avg_humidity, is_valid in zip(
+                dates, avg_humidities.tolist(), valid.tolist()
+            ):
+                if not is_valid:
+                    continue
                 humidities = daily_humidity[date]
-                if humidities:
-                    avg_humidity = sum(h["humidity"] for h in humidities) / len(humidities)
-                    avg_std = sum(h["std"] for h in humidities) / len(humidities)
-
-                    # Validate humidity in range [0, 100]
-                    if 0 <= avg_humidity <= 100:
-                        results.append(
-                            {
-                                "date": date,
-                                "humidity_percent": round(avg_humidity, 2),
-                                "std": round(avg_std, 2),
-                            }
-                        )
+                avg_std = sum(h["std"] for h in humidities) / len(humidities)
+
+                results.append(
+                    {
+                        "date": date,
+                        "humidity_percent": round(avg_humidity, 2),
+                        "std": round(avg_std, 2),
+                    }
+                )
 
             logger.info(f"Successfully calculated humidity for {len(results)} dates")
             return results
@@ -573,17 +629,14 @@ class NDVIService:
 
         self.ee_manager.initialize()
 
-        try:
-            result = await asyncio.to_thread(
-                self._compute_lst_sync,
-                farm_geojson,
-                start_date,
-                end_date,
-            )
-            return result
-        except Exception as e:
-            logger.error(f"LST calculation failed: {e}")
-            raise
+        return await self._run_cached_series(
+            "lst",
+            "LST",
+            self._compute_lst_sync,
+            farm_geojson,
+            start_date,
+            end_date,
+        )
 
     def _compute_lst_sync(
         self,
@@ -626,19 +679,19 @@ class NDVIService:
                     {
                         "date": ee.Date(img.get("system:time_start")).format("YYYY-MM-dd"),
                         "lst_day_celsius": lst_day_celsius.reduceRegion(
-                            reducer=ee.Reducer.mean(),
+                            reducer=_reducer("mean"),
                             geometry=geometry,
                             scale=1000,
                             maxPixels=1e9,
                         ).get("LST_Day_1km"),
                         "lst_night_celsius": lst_night_celsius.reduceRegion(
-                            reducer=ee.Reducer.mean(),
+                            reducer=_reducer("mean"),
                             geometry=geometry,
                             scale=1000,
                             maxPixels=1e9,
                         ).get("LST_Night_1km"),
                         "std": img.select(["LST_Day_1km"]).reduceRegion(
-                            reducer=ee.Reducer.stdDev(),
+                            reducer=_reducer("stdDev"),
                             geometry=geometry,
                             scale=1000,
                             maxPixels=1e9,
@@ -677,15 +730,99 @@ class NDVIService:
                 raise EarthEngineQuotaError(str(e)) from e
             raise EarthEngineError(str(e)) from e
 
-    def _validate_environmental_data(self, value: float) -> None:
+    async def calculate_all_environmental(
+        self,
+        farm_geojson: dict,
+        start_date: str,
+        end_date: str,
+    ) -> Dict[str, Union[List[dict], Exception]]:
         """
-        Validate temperature/humidity ranges.
+        Calculate temperature, humidity and LST time series concurrently.
+
+        The three Earth Engine queries are independent, so they run under
+        asyncio.gather and the total latency is that of the slowest one.
+
+        Args:
+            farm_geojson: GeoJSON geometry of farm boundary
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+
+        Returns:
+            Dict with keys "temperature", "humidity" and "lst". Each value is
+            the corresponding time series, or the exception raised for that
+            dataset so one failure does not discard the others.
 
         Raises:
-            ValueError: If value is outside reasonable ranges
+            InvalidGeometryError: If GeoJSON is invalid
+            InvalidDateRangeError: If dates are invalid
+        """
+        # Validate and initialize once; the per-dataset public methods would
+        # each repeat both, so go straight to the cached computations
+        self._validate_geojson(farm_geojson)
+        self._validate_date_range(start_date, end_date)
+
+        self.ee_manager.initialize()
+
+        args = (farm_geojson, start_date, end_date)
+        temperature, humidity, lst = await asyncio.gather(
+            self._run_cached_series(
+                "temperature", "Temperature", self._compute_temperature_sync, *args
+            ),
+            self._run_cached_series(
+                "humidity", "Humidity", self._compute_humidity_sync, *args
+            ),
+            self._run_cached_series("lst", "LST", self._compute_lst_sync, *args),
+            return_exceptions=True,
+        )
+
+        return {"temperature": temperature, "humidity": humidity, "lst": lst}
+
+    async def _run_cached_series(
+        self,
+        dataset: str,
+        label: str,
+        compute: Callable[[dict, str, str], List[dict]],
+        farm_geojson: dict,
+        start_date: str,
+        end_date: str,
+    ) -> List[dict]:
         """
-        if not isinstance(value, (int, float)):
-            raise ValueError(f"Environmental value must be numeric, got {type(value)}")
+        Run an already validated time-series computation in a worker thread.
+
+        Results go through cached_time_series under the dataset name; label
+        is only used in the failure log message.
+        """
+        try:
+            return await asyncio.to_thread(
+                cached_time_series,
+                dataset,
+                compute,
+                farm_geojson,
+                start_date,
+                end_date,
+            )
+        except Exception as e:
+            logger.error(f"{label} calculation failed: {e}")
+            raise
+
+    @staticmethod
+    def _environmental_range_mask(
+        values: np.ndarray, low: float, high: float
+    ) -> np.ndarray:
+        """Boolean mask of values that are finite and within [low, high]."""
+        values = np.asarray(values, dtype=float)
+        return np.isfinite(values) & (values >= low) & (values <= high)
+
+    @staticmethod
+    def _log_dropped_days(
+        valid: np.ndarray, variable: str, bounds: Tuple[float, float]
+    ) -> None:
+        """Warn about daily values removed by a range mask."""
+        dropped = int(valid.size - np.count_nonzero(valid))
+        if dropped:
+            logger.warning(
+                f"Dropped {dropped} day(s) with {variable} outside {list(bounds)}"
+            )
 
     def _calculate_relative_humidity(self, img: ee.Image) -> ee.Image:
         """
@@ -717,23 +854,68 @@ class NDVIService:
 
         return rh
 
+    @staticmethod
+    def _magnus_numpy(t2m_kelvin, d2m_kelvin) -> np.ndarray:
+        """
+        Client-side Magnus formula for temperature/dewpoint arrays already in memory.
+
+        Same formula as _calculate_relative_humidity, evaluated with NumPy
+        ufuncs instead of an Earth Engine expression round-trip.
+
+        Args:
+            t2m_kelvin: Air temperature at 2 m (Kelvin), scalar or array
+            d2m_kelvin: Dewpoint temperature at 2 m (Kelvin), scalar or array
+
+        Returns:
+            Relative humidity in percent, same shape as the inputs
+        """
+        t_celsius = np.asarray(t2m_kelvin, dtype=float) - 273.15
+        td_celsius = np.asarray(d2m_kelvin, dtype=float) - 273.15
+
+        # RH = e / es * 100 with both pressures sharing the 6.112 factor,
+        # so it reduces to a single exp of the exponent difference
+        exponent = (17.67 * td_celsius) / (td_celsius + 243.5) - (
+            17.67 * t_celsius
+        ) / (t_celsius + 243.5)
+        return 100.0 * np.exp(exponent)
+
     def _filter_by_quality_flags(
-        self, img: ee.Image, qc_band: str, data_band: str
-    ) -> ee.Image:
+        self,
+        img: Union[ee.Image, Dict[str, np.ndarray]],
+        qc_band: str,
+        data_band: str,
+    ) -> Union[ee.Image, np.ndarray]:
         """
         Filter image by quality control flags.
 
         Keeps only pixels with good quality flags (typically 0 or 1).
+        A dict of already-downloaded band arrays is filtered client-side
+        with _qc_mask_numpy instead of an Earth Engine round-trip.
 
         Args:
-            img: Earth Engine image
+            img: Earth Engine image, or dict mapping band name to ndarray
             qc_band: Name of quality control band
             data_band: Name of data band to filter
 
         Returns:
-            Filtered image with only good quality pixels
+            Filtered image with only good quality pixels; for band arrays, a
+            float array with NaN where the QC flag is rejected
         """
+        if isinstance(img, dict):
+            mask = self._qc_mask_numpy(img[qc_band])
+            return np.where(mask, np.asarray(img[data_band], dtype=float), np.nan)
+
         qc = img.select(qc_band)
         # Keep pixels where QC is 0 or 1 (good/acceptable quality)
         mask = qc.lte(1)
         return img.select(data_band).updateMask(mask)
+
+    @staticmethod
+    def _qc_mask_numpy(qc: np.ndarray) -> np.ndarray:
+        """
+        Boolean mask of acceptable MODIS QC values, the client-side qc.lte(1).
+
+        Every bit above bit 0 must be clear, tested with one bitwise AND.
+        """
+        qc = np.asarray(qc)
+        return (qc & ~np.array(1, dtype=qc.dtype)) == 0
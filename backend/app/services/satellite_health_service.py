@@ -2,15 +2,21 @@
 
 import asyncio
 import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple
 
 import ee
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.core.config import settings
 from app.models.satellite_status import SatelliteStatus
 from app.services.earth_engine import EarthEngineManager
+from app.services.ee_cache import cached_call
 from app.services.exceptions import (
     EarthEngineError,
     EarthEngineQuotaError,
@@ -19,6 +25,22 @@ from app.services.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Worker threads for the blocking getInfo() calls of health checks, shared by
+# all service instances. Kept apart from the default executor so a slow
+# refresh cannot hold up the NDVI/carbon request path.
+_health_check_executor = ThreadPoolExecutor(
+    max_workers=6, thread_name_prefix="ee-health"
+)
+
+# Most recent health summary as (monotonic expiry time, summary)
+_summary_cache: Optional[Tuple[float, Dict[str, any]]] = None
+
+
+def clear_summary_cache() -> None:
+    """Drop the cached health summary so the next request reads the database."""
+    global _summary_cache
+    _summary_cache = None
+
 
 class SatelliteHealthService:
     """
@@ -34,15 +56,48 @@ class SatelliteHealthService:
         """Initialize service with Earth Engine manager."""
         self.ee_manager = EarthEngineManager.get_instance()
 
-    async def check_sentinel2_health(self) -> Dict[str, any]:
+    async def _cached_check(
+        self, satellite: str, check: Callable[[], Dict[str, any]], force: bool = False
+    ) -> Dict[str, any]:
+        """
+        Run a blocking health check on the shared pool, reusing a recent result.
+
+        Results are cached per satellite and UTC day (the 30-day window the
+        checks query) for SATELLITE_HEALTH_CACHE_TTL_SECONDS, so dashboard
+        polling and retries skip the Earth Engine round-trips. With force,
+        the check always runs and its result replaces the cached one.
+        """
+        key = ("satellite-health", satellite, datetime.utcnow().strftime("%Y-%m-%d"))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _health_check_executor,
+            partial(
+                cached_call,
+                key,
+                check,
+                settings.SATELLITE_HEALTH_CACHE_TTL_SECONDS,
+                force=force,
+            ),
+        )
+
+    async def check_sentinel2_health(self, force: bool = False) -> Dict[str, any]:
         """
         Check Sentinel-2 satellite health.
 
         Evaluates coverage, cloud cover, and availability over last 30 days.
 
+        Args:
+            force: Run the check even if a cached result exists
+
         Returns:
             Dict with metrics: coverage_percent, accuracy_percent, status, metadata
         """
+        return await self._cached_check(
+            "sentinel-2", self._check_sentinel2_health_sync, force=force
+        )
+
+    def _check_sentinel2_health_sync(self) -> Dict[str, any]:
+        """Synchronous Sentinel-2 health check (blocking Earth Engine calls)."""
         try:
             self.ee_manager.initialize()
 
@@ -58,7 +113,15 @@ class SatelliteHealthService:
                 )
             )
 
-            size = collection.size().getInfo()
+            # Check cloud cover; both counts come back in one round-trip
+            low_cloud_collection = collection.filter(
+                ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", 20)
+            )
+            counts = ee.Dictionary(
+                {"total": collection.size(), "good": low_cloud_collection.size()}
+            ).getInfo()
+            size = counts["total"]
+            low_cloud_count = counts["good"]
             logger.info(f"Found {size} Sentinel-2 images in last 30 days")
 
             if size == 0:
@@ -71,12 +134,6 @@ class SatelliteHealthService:
                     "metadata": {"error": "No data available"},
                 }
 
-            # Check cloud cover
-            low_cloud_collection = collection.filter(
-                ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", 20)
-            )
-            low_cloud_count = low_cloud_collection.size().getInfo()
-
             # Calculate metrics
             coverage_percent = (low_cloud_count / size) * 100 if size > 0 else 0
             accuracy_percent = coverage_percent  # Cloud cover is main quality metric
@@ -119,15 +176,24 @@ class SatelliteHealthService:
                 raise EarthEngineQuotaError(str(e)) from e
             raise SatelliteHealthCheckError(f"Sentinel-2 check failed: {str(e)}") from e
 
-    async def check_landsat8_health(self) -> Dict[str, any]:
+    async def check_landsat8_health(self, force: bool = False) -> Dict[str, any]:
         """
         Check Landsat-8 satellite health.
 
         Evaluates coverage, QA quality flags, and availability.
 
+        Args:
+            force: Run the check even if a cached result exists
+
         Returns:
             Dict with metrics: coverage_percent, accuracy_percent, status, metadata
         """
+        return await self._cached_check(
+            "landsat-8", self._check_landsat8_health_sync, force=force
+        )
+
+    def _check_landsat8_health_sync(self) -> Dict[str, any]:
+        """Synchronous Landsat-8 health check (blocking Earth Engine calls)."""
         try:
             self.ee_manager.initialize()
 
@@ -142,7 +208,15 @@ class SatelliteHealthService:
                 )
             )
 
-            size = collection.size().getInfo()
+            # Filter by quality (assume images with lower cloud cover are higher quality)
+            # Landsat provides QA_PIXEL band for quality assessment; both
+            # counts come back in one round-trip
+            good_quality = collection.filter(ee.Filter.lt("CLOUD_COVER", 25))
+            counts = ee.Dictionary(
+                {"total": collection.size(), "good": good_quality.size()}
+            ).getInfo()
+            size = counts["total"]
+            good_count = counts["good"]
             logger.info(f"Found {size} Landsat-8 images in last 30 days")
 
             if size == 0:
@@ -155,11 +229,6 @@ class SatelliteHealthService:
                     "metadata": {"error": "No data available"},
                 }
 
-            # Filter by quality (assume images with lower cloud cover are higher quality)
-            # Landsat provides QA_PIXEL band for quality assessment
-            good_quality = collection.filter(ee.Filter.lt("CLOUD_COVER", 25))
-            good_count = good_quality.size().getInfo()
-
             coverage_percent = (good_count / size) * 100 if size > 0 else 0
             accuracy_percent = coverage_percent
 
@@ -200,15 +269,24 @@ class SatelliteHealthService:
                 raise EarthEngineQuotaError(str(e)) from e
             raise SatelliteHealthCheckError(f"Landsat-8 check failed: {str(e)}") from e
 
-    async def check_era5_health(self) -> Dict[str, any]:
+    async def check_era5_health(self, force: bool = False) -> Dict[str, any]:
         """
         Check ERA5-Land satellite health.
 
         Evaluates temporal continuity and data availability.
 
+        Args:
+            force: Run the check even if a cached result exists
+
         Returns:
             Dict with metrics: coverage_percent, accuracy_percent, status, metadata
         """
+        return await self._cached_check(
+            "era5-land", self._check_era5_health_sync, force=force
+        )
+
+    def _check_era5_health_sync(self) -> Dict[str, any]:
+        """Synchronous ERA5-Land health check (blocking Earth Engine calls)."""
         try:
             self.ee_manager.initialize()
 
@@ -272,22 +350,26 @@ class SatelliteHealthService:
                 raise EarthEngineQuotaError(str(e)) from e
             raise SatelliteHealthCheckError(f"ERA5-Land check failed: {str(e)}") from e
 
-    async def update_all_satellite_status(self, db: AsyncSession) -> None:
+    async def update_all_satellite_status(
+        self, db: AsyncSession, force: bool = False
+    ) -> None:
         """
         Check and update health status for all satellites.
 
-        Runs health checks in parallel using asyncio.gather().
+        Runs health checks in parallel using asyncio.gather(); each check's
+        blocking Earth Engine calls run on a worker thread.
         Updates SatelliteStatus records in database.
 
         Args:
             db: Database session for storing updates
+            force: Bypass cached check results (manual refreshes)
         """
         try:
             # Run all health checks in parallel
             results = await asyncio.gather(
-                self.check_sentinel2_health(),
-                self.check_landsat8_health(),
-                self.check_era5_health(),
+                self.check_sentinel2_health(force=force),
+                self.check_landsat8_health(force=force),
+                self.check_era5_health(force=force),
                 return_exceptions=True,
             )
 
@@ -352,6 +434,7 @@ class SatelliteHealthService:
                     logger.info(f"Created new status record for {sat_name}")
 
             await db.commit()
+            clear_summary_cache()
             logger.info("Satellite health status update complete")
 
         except Exception as e:
@@ -367,7 +450,9 @@ class SatelliteHealthService:
         """
         Retrieve current health summary for all satellites.
 
-        Returns formatted summary with aggregated metrics.
+        Returns formatted summary with aggregated metrics. The summary is
+        reused for SATELLITE_HEALTH_SUMMARY_TTL_SECONDS (dashboards poll this
+        endpoint) and dropped as soon as update_all_satellite_status commits.
 
         Args:
             db: Database session
@@ -375,6 +460,18 @@ class SatelliteHealthService:
         Returns:
             Dictionary with satellite list and aggregate statistics
         """
+        global _summary_cache
+        if _summary_cache is not None and _summary_cache[0] > time.monotonic():
+            return dict(_summary_cache[1])
+
+        summary = await self._build_health_summary(db)
+        ttl = settings.SATELLITE_HEALTH_SUMMARY_TTL_SECONDS
+        if ttl > 0:
+            _summary_cache = (time.monotonic() + ttl, summary)
+        return dict(summary)
+
+    async def _build_health_summary(self, db: AsyncSession) -> Dict[str, any]:
+        """Query all satellite records and aggregate them into a summary."""
         result = await db.execute(select(SatelliteStatus).order_by("satellite_name"))
         satellites = result.scalars().all()
 
@@ -390,25 +487,18 @@ class SatelliteHealthService:
                 "last_check": datetime.utcnow(),
             }
 
-        # Calculate aggregates
-        operational_count = sum(1 for s in satellites if s.is_operational)
-        degraded_count = sum(1 for s in satellites if s.is_degraded)
-        offline_count = sum(1 for s in satellites if s.is_offline)
-        average_uptime = (
-            sum(s.uptime_percent for s in satellites) / len(satellites)
-            if satellites
-            else 0.0
-        )
-
-        # Find latest check time
-        last_check = max(s.last_update for s in satellites) if satellites else datetime.utcnow()
+        # Calculate aggregates from the rows already loaded for the
+        # per-satellite list; statuses are counted in one pass
+        status_counts = Counter(s.status for s in satellites)
+        average_uptime = sum(s.uptime_percent for s in satellites) / len(satellites)
+        last_check = max(s.last_update for s in satellites)
 
         return {
             "satellites": satellites,
             "total_satellites": len(satellites),
-            "operational_count": operational_count,
-            "degraded_count": degraded_count,
-            "offline_count": offline_count,
+            "operational_count": status_counts["operational"],
+            "degraded_count": status_counts["degraded"],
+            "offline_count": status_counts["offline"],
             "average_uptime": round(average_uptime, 2),
             "last_check": last_check,
         }
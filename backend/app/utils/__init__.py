@@ -6,10 +6,18 @@ from app.utils.geojson import (
     geojson_to_postgis_sql,
     calculate_area_hectares_sql,
 )
+from app.utils.validation import (
+    SUPPORTED_GEOMETRY_TYPES,
+    ISO_DATE_RE,
+    validate_date_range,
+)
 
 __all__ = [
     "geometry_to_geojson",
     "geojson_to_wkt",
     "geojson_to_postgis_sql",
     "calculate_area_hectares_sql",
+    "SUPPORTED_GEOMETRY_TYPES",
+    "ISO_DATE_RE",
+    "validate_date_range",
 ]
@@ -0,0 +1,61 @@
+"""Request validation helpers shared by the Earth Engine services."""
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Tuple
+
+# Geometry types accepted by the services' GeoJSON validation
+SUPPORTED_GEOMETRY_TYPES = frozenset({"Point", "Polygon", "MultiPolygon", "LineString"})
+
+# Shape of a YYYY-MM-DD date string (ASCII digits only)
+ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# Longest date range a single request may cover (5 years)
+MAX_DATE_RANGE_DAYS = 365 * 5
+
+
+@lru_cache(maxsize=1024)
+def validate_date_range(start_date: str, end_date: str) -> Tuple[date, date]:
+    """
+    Validate a YYYY-MM-DD date range and return it as dates.
+
+    date.fromisoformat is much faster than strptime but also accepts the
+    basic (YYYYMMDD) and week-date forms, so both strings are matched
+    against ISO_DATE_RE first; malformed input is rejected there without
+    reaching the parser. Memoized on the two strings; failures raise and
+    are never cached.
+
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+
+    Returns:
+        Tuple of (start, end) dates
+
+    Raises:
+        ValueError: If a date is malformed, start is not before end, or the
+            range is longer than MAX_DATE_RANGE_DAYS
+    """
+    if not (ISO_DATE_RE.fullmatch(start_date) and ISO_DATE_RE.fullmatch(end_date)):
+        raise ValueError(
+            f"Invalid date format. Use YYYY-MM-DD: {start_date!r}, {end_date!r}"
+        )
+
+    try:
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+    except ValueError as e:
+        # Right shape but not a calendar day, e.g. 2023-02-30
+        raise ValueError(f"Invalid date format. Use YYYY-MM-DD: {str(e)}") from e
+
+    if start >= end:
+        raise ValueError(
+            f"Start date must be before end date: {start_date} >= {end_date}"
+        )
+
+    days_diff = (end - start).days
+    if days_diff > MAX_DATE_RANGE_DAYS:
+        raise ValueError(f"Date range too large: {days_diff} days (max 5 years)")
+
+    return start, end
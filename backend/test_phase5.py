@@ -24,7 +24,7 @@ async def test_carbon_service_calculation():
         {"date": datetime.now() - timedelta(days=10), "ndvi": 0.72},
     ]
     
-    result = await CarbonService.estimate_carbon_sequestration(
+    result = await CarbonService.estimate_carbon_sequestration_async(
         ndvi_data=ndvi_data,
         area_ha=50.0,
         start_date=datetime.now() - timedelta(days=30),
@@ -41,7 +41,7 @@ async def test_carbon_service_calculation():
 async def test_carbon_service_empty_data():
     """Test carbon service with empty data."""
     try:
-        await CarbonService.estimate_carbon_sequestration(
+        await CarbonService.estimate_carbon_sequestration_async(
             ndvi_data=[],
             area_ha=50.0,
             start_date=datetime.now() - timedelta(days=30),
@@ -57,7 +57,7 @@ async def test_carbon_service_invalid_area():
     ndvi_data = [{"date": datetime.now(), "ndvi": 0.65}]
     
     try:
-        await CarbonService.estimate_carbon_sequestration(
+        await CarbonService.estimate_carbon_sequestration_async(
             ndvi_data=ndvi_data,
             area_ha=-50.0,
             start_date=datetime.now() - timedelta(days=30),
@@ -73,7 +73,7 @@ async def test_carbon_service_invalid_dates():
     ndvi_data = [{"date": datetime.now(), "ndvi": 0.65}]
     
     try:
-        await CarbonService.estimate_carbon_sequestration(
+        await CarbonService.estimate_carbon_sequestration_async(
             ndvi_data=ndvi_data,
             area_ha=50.0,
             start_date=datetime.now(),
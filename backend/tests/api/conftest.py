@@ -0,0 +1,85 @@
+"""Shared fixtures for API endpoint tests."""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import Depends, HTTPException, status
+from fastapi.testclient import TestClient
+
+from app.core.database import get_db
+from app.core.security import get_current_user_db, oauth2_scheme
+from app.main import app
+
+TEST_TOKEN = "test-token"
+
+
+class _StubSatelliteService:
+    """Minimal stand-in for SatelliteHealthService used by the routes.
+
+    Tests configure behaviour through class attributes: ``_summary`` is
+    returned from ``get_satellite_health_summary`` and ``_refresh_exc``,
+    when set, is raised from ``update_all_satellite_status``. The keyword
+    arguments of the last refresh are recorded in ``_refresh_kwargs``.
+    """
+
+    _summary = None
+    _refresh_exc = None
+    _refresh_kwargs = None
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def get_satellite_health_summary(self, *args, **kwargs):
+        return self._summary
+
+    async def update_all_satellite_status(self, *args, **kwargs):
+        type(self)._refresh_kwargs = kwargs
+        if self._refresh_exc:
+            raise self._refresh_exc
+
+
+async def _override_current_user(token: str = Depends(oauth2_scheme)):
+    """Accept only the test bearer token, mirroring the real 401 behaviour."""
+    if token != TEST_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return SimpleNamespace(id=1, email="test@example.com", is_active=True)
+
+
+async def _override_get_db():
+    """Routes under test talk to a stubbed service, so no session is needed."""
+    yield None
+
+
+@pytest.fixture(scope="session")
+def client():
+    """FastAPI test client shared across the test session."""
+    app.dependency_overrides[get_current_user_db] = _override_current_user
+    app.dependency_overrides[get_db] = _override_get_db
+    try:
+        with TestClient(app) as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Valid authentication headers, built once per session."""
+    return httpx.Headers({"Authorization": f"Bearer {TEST_TOKEN}"})
+
+
+@pytest.fixture
+def satellite_service_mock(monkeypatch):
+    """Patch the satellites router to use a fresh service stub."""
+    monkeypatch.setattr(_StubSatelliteService, "_summary", None)
+    monkeypatch.setattr(_StubSatelliteService, "_refresh_exc", None)
+    monkeypatch.setattr(_StubSatelliteService, "_refresh_kwargs", None)
+    monkeypatch.setattr(
+        "app.api.v1.satellites.SatelliteHealthService", _StubSatelliteService
+    )
+    return _StubSatelliteService
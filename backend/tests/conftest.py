@@ -1,21 +1,82 @@
 """Pytest configuration and fixtures for backend tests."""
 
-import os
 import sys
+import types
+from unittest.mock import MagicMock
 
-# Add backend to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
+import numpy as np
 import pytest
 
+# Earth Engine API objects used by the services; each is a MagicMock on the
+# stand-in module so tests can configure return values per call chain.
+_FAKE_EE_ATTRIBUTES = (
+    "Authenticate",
+    "Date",
+    "Dictionary",
+    "Feature",
+    "Filter",
+    "Geometry",
+    "Image",
+    "ImageCollection",
+    "Initialize",
+    "Number",
+    "Reducer",
+    "ServiceAccountCredentials",
+)
+
+
+def _install_fake_ee() -> types.ModuleType:
+    """
+    Register a stand-in `ee` module before any app module imports it.
+
+    The tests never talk to Earth Engine, and importing the real client
+    (google-auth, HTTP transport) is the slowest part of collecting the
+    suite. EEException is a real exception class so the services'
+    `except ee.EEException` clauses still work.
+    """
+    fake_ee = types.ModuleType("ee")
+    fake_ee.EEException = type("EEException", (Exception,), {})
+    for name in _FAKE_EE_ATTRIBUTES:
+        setattr(fake_ee, name, MagicMock(name=f"ee.{name}"))
+    sys.modules["ee"] = fake_ee
+    return fake_ee
+
+
+_fake_ee = _install_fake_ee()
+
+
+def pytest_addoption(parser):
+    """Register command-line options for the test suite."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
-def pytest_configure(config):
-    """Configure pytest before test collection."""
-    # Set environment variables BEFORE any imports of the app
-    os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
-    os.environ.setdefault("SECRET_KEY", "test-secret-key-aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa")
-    os.environ.setdefault("GEE_PROJECT", "test-gee-project")
-    os.environ.setdefault("ENVIRONMENT", "test")
+
+@pytest.fixture(scope="session")
+def fake_ee():
+    """The stand-in `ee` module shared by the whole test session."""
+    return _fake_ee
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_ee():
+    """Clear calls and return values configured on the fake ee by a test."""
+    yield
+    for name in _FAKE_EE_ATTRIBUTES:
+        getattr(_fake_ee, name).reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
@@ -25,3 +86,25 @@ def test_settings():
     return settings
 
 
+@pytest.fixture
+def ee_cache_dir(tmp_path, monkeypatch):
+    """Enable the Earth Engine result cache in an isolated directory."""
+    from app.core.config import settings
+    from app.services import ee_cache
+
+    monkeypatch.setattr(settings, "EE_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "EE_CACHE_DIR", str(tmp_path / "ee_cache"))
+    monkeypatch.setattr(ee_cache, "_cache", None)
+    yield tmp_path
+    if ee_cache._cache is not None:
+        ee_cache._cache.close()
+
+
+@pytest.fixture(autouse=True)
+def _seed_numpy(monkeypatch):
+    """Seed NumPy RNGs so stochastic tests are reproducible."""
+    from app.services import carbon_service
+
+    np.random.seed(42)
+    monkeypatch.setattr(carbon_service, "_rng", carbon_service._make_rng(42))
+    yield
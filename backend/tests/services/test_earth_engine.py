@@ -11,10 +11,12 @@ from app.services.exceptions import EarthEngineAuthError, EarthEngineQuotaError
 class TestEarthEngineManager:
     """Test Earth Engine singleton pattern and initialization."""
 
-    def setup_method(self):
-        """Reset singleton before each test."""
-        EarthEngineManager._instance = None
-        EarthEngineManager._initialized = False
+    @pytest.fixture(autouse=True)
+    def _reset_ee(self, monkeypatch):
+        """Give each test a fresh singleton and restore the original afterwards."""
+        monkeypatch.setattr(EarthEngineManager, "_instance", None)
+        monkeypatch.setattr(EarthEngineManager, "_initialized", False)
+        yield
 
     def test_singleton_pattern(self):
         """Test that multiple calls return same instance."""
@@ -46,6 +48,16 @@ class TestEarthEngineManager:
         # All instances should be the same
         assert len(set(id(instance) for instance in instances)) == 1
 
+    def test_get_instance_fast_path_skips_lock(self):
+        """Test get_instance does not take the lock once the instance exists."""
+        manager = EarthEngineManager.get_instance()
+
+        with patch.object(EarthEngineManager, "_instance_lock") as mock_lock:
+            assert EarthEngineManager.get_instance() is manager
+            assert EarthEngineManager() is manager
+
+        mock_lock.__enter__.assert_not_called()
+
     def test_is_initialized_default_false(self):
         """Test is_initialized returns False initially."""
         manager = EarthEngineManager.get_instance()
@@ -1,11 +1,18 @@
 """Tests for environmental data service methods."""
 
+import threading
+
+import numpy as np
 import pytest
 from datetime import datetime, date
 from unittest.mock import MagicMock, AsyncMock, patch
-import ee
 
-from app.services.ndvi_service import NDVIService
+from app.services.ndvi_service import (
+    HUMIDITY_RANGE_PERCENT,
+    TEMPERATURE_RANGE_C,
+    NDVIService,
+)
+from app.services.ee_cache import geojson_key
 from app.services.exceptions import InvalidGeometryError, InvalidDateRangeError, EarthEngineError
 
 
@@ -125,16 +132,14 @@ class TestHumidityCalculation:
 
     def test_calculate_relative_humidity_magnus_formula(self):
         """Test Magnus formula for relative humidity calculation."""
-        service = NDVIService()
-        
-        # Create mock image with temperature and dewpoint bands
-        mock_img = MagicMock(spec=ee.Image)
-        
-        with patch.object(service, '_calculate_relative_humidity') as mock_calc:
-            mock_calc.return_value = MagicMock(spec=ee.Image)
-            result = service._calculate_relative_humidity(mock_img)
-            
-            assert result is not None
+        t2m = np.array([288.15, 293.15])  # 15 °C, 20 °C
+        d2m = np.array([283.15, 293.15])  # 10 °C, 20 °C (saturated)
+
+        rh = NDVIService._magnus_numpy(t2m, d2m)
+
+        # es(15 °C) = 17.0405 hPa, e(10 °C) = 12.2717 hPa -> RH = 72.015 %
+        expected = np.array([72.015, 100.0])
+        np.testing.assert_allclose(rh, expected, rtol=1e-3)
 
     def test_humidity_valid_range(self):
         """Test that calculated humidity is within valid range [0, 100]."""
@@ -181,9 +186,9 @@ class TestLandSurfaceTemperatureCalculation:
         """Test quality flag filtering for MODIS data."""
         service = NDVIService()
         
-        mock_img = MagicMock(spec=ee.Image)
+        mock_img = MagicMock()
         mock_img.select.return_value = mock_img
-        mock_img.lte.return_value = MagicMock(spec=ee.Image)
+        mock_img.lte.return_value = MagicMock()
         mock_img.updateMask.return_value = mock_img
         
         with patch.object(service, '_filter_by_quality_flags') as mock_filter:
@@ -192,25 +197,84 @@ class TestLandSurfaceTemperatureCalculation:
             
             assert result is not None
 
+    def test_filter_by_quality_flags_numpy(self):
+        """Test client-side QC filtering of downloaded MODIS band arrays."""
+        service = NDVIService()
+        qc = np.random.default_rng(0).integers(0, 4, 10_000, dtype=np.uint8)
+        qc[:4] = [0, 1, 2, 0b101]
+        lst = np.full(qc.shape, 300.0)
+
+        mask = service._qc_mask_numpy(qc)
+        filtered = service._filter_by_quality_flags(
+            {"QC_Day": qc, "LST_Day_1km": lst}, "QC_Day", "LST_Day_1km"
+        )
+
+        assert mask.dtype == bool
+        assert mask.sum() == np.count_nonzero(qc <= 1)
+        assert mask[:4].tolist() == [True, True, False, False]
+        np.testing.assert_array_equal(np.isnan(filtered), ~mask)
+
 
 class TestEnvironmentalDataValidation:
     """Tests for environmental data validation."""
 
-    def test_validate_environmental_data_valid(self):
-        """Test validation of valid environmental data."""
+    def test_environmental_range_mask_bulk(self):
+        """Test a large array is checked with a single mask."""
+        values = np.random.default_rng(0).uniform(0.0, 100.0, 100_000)
+        values[54_321] = 100.5
+        values[99_999] = np.nan
+
+        mask = NDVIService._environmental_range_mask(values, *HUMIDITY_RANGE_PERCENT)
+
+        assert mask.dtype == bool
+        assert np.flatnonzero(~mask).tolist() == [54_321, 99_999]
+        # Temperature bounds are inclusive
+        assert NDVIService._environmental_range_mask(
+            np.array(TEMPERATURE_RANGE_C), *TEMPERATURE_RANGE_C
+        ).all()
+
+    @staticmethod
+    def _era5_features(fake_ee, features):
+        """Wire the fake ee so an ERA5-Land query returns `features`."""
+        collection = fake_ee.ImageCollection.return_value.filterBounds.return_value
+        collection = collection.filterDate.return_value.select.return_value
+        collection.size.return_value.getInfo.return_value = len(features)
+        collection.map.return_value.getInfo.return_value = {"features": features}
+
+    def test_temperature_drops_implausible_days(self, fake_ee):
+        """Test out-of-range daily temperatures are dropped, not raised."""
         service = NDVIService()
-        
-        # Should not raise
-        service._validate_environmental_data(25.5)
-        service._validate_environmental_data(-5.0)
-        service._validate_environmental_data(0.0)
-
-    def test_validate_environmental_data_invalid_type(self):
-        """Test validation rejects non-numeric values."""
+        self._era5_features(
+            fake_ee,
+            [
+                {"properties": {"date": "2024-01-01", "temperature_celsius": 20.0}},
+                {"properties": {"date": "2024-01-01", "temperature_celsius": 22.0}},
+                {"properties": {"date": "2024-01-02", "temperature_celsius": 75.0}},
+                {"properties": {"date": "2024-01-03", "temperature_celsius": -5.0}},
+            ],
+        )
+
+        result = service._compute_temperature_sync(
+            VALID_GEOJSON, "2024-01-01", "2024-01-31"
+        )
+
+        assert [r["date"] for r in result] == ["2024-01-01", "2024-01-03"]
+        assert result[0]["temperature_celsius"] == 21.0
+
+    def test_humidity_drops_implausible_days(self, fake_ee):
+        """Test out-of-range daily humidity is dropped like temperature."""
         service = NDVIService()
-        
-        with pytest.raises(ValueError):
-            service._validate_environmental_data("not_a_number")
+        self._era5_features(
+            fake_ee,
+            [
+                {"properties": {"date": "2024-01-01", "humidity_percent": 65.0}},
+                {"properties": {"date": "2024-01-02", "humidity_percent": 104.0}},
+            ],
+        )
+
+        result = service._compute_humidity_sync(VALID_GEOJSON, "2024-01-01", "2024-01-31")
+
+        assert [r["date"] for r in result] == ["2024-01-01"]
 
     def test_validate_date_format(self):
         """Test date format validation."""
@@ -351,3 +415,136 @@ class TestEnvironmentalDataEdgeCases:
                         start_date="2024-01-01",
                         end_date="2024-01-31",
                     )
+
+
+class TestEarthEngineCache:
+    """Tests for the on-disk Earth Engine result cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_avoids_ee_call(self, ee_cache_dir):
+        """Test a repeated identical request is served from the cache."""
+        service = NDVIService()
+        series = [{"date": "2024-01-15", "temperature_celsius": 25.5, "std": 2.1}]
+
+        with patch.object(service.ee_manager, 'initialize'):
+            with patch.object(service, '_compute_temperature_sync') as mock_compute:
+                mock_compute.return_value = series
+
+                for _ in range(2):
+                    result = await service.calculate_temperature_time_series(
+                        farm_geojson=VALID_GEOJSON,
+                        start_date="2024-01-01",
+                        end_date="2024-01-31",
+                    )
+                    assert result == series
+
+        mock_compute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_date_range(self, ee_cache_dir):
+        """Test different date ranges are computed separately."""
+        service = NDVIService()
+
+        with patch.object(service.ee_manager, 'initialize'):
+            with patch.object(service, '_compute_temperature_sync') as mock_compute:
+                mock_compute.return_value = [{"date": "2024-01-15"}]
+
+                for end_date in ("2024-01-31", "2024-02-29"):
+                    await service.calculate_temperature_time_series(
+                        farm_geojson=VALID_GEOJSON,
+                        start_date="2024-01-01",
+                        end_date=end_date,
+                    )
+
+        assert mock_compute.call_count == 2
+
+    def test_geojson_key_ignores_key_order(self):
+        """Test equal GeoJSON objects hash to the same compact key."""
+        reordered = {"geometry": VALID_GEOJSON["geometry"], "type": "Feature"}
+        moved = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [34.5, -0.5]},
+        }
+
+        key = geojson_key(VALID_GEOJSON)
+
+        assert key == geojson_key(reordered)
+        assert key != geojson_key(moved)
+        assert len(key) == 32
+
+
+class TestCombinedEnvironmentalCalculation:
+    """Tests for concurrent temperature, humidity and LST calculation."""
+
+    @pytest.mark.asyncio
+    async def test_calculate_all_environmental_runs_concurrently(self):
+        """Test the three Earth Engine queries overlap instead of running serially."""
+        service = NDVIService()
+        # Each computation waits for the other two; run serially, the
+        # barrier would time out and break
+        barrier = threading.Barrier(3, timeout=5)
+
+        def compute(*args, **kwargs):
+            barrier.wait()
+            return [{"date": "2024-01-15"}]
+
+        with patch.object(service.ee_manager, 'initialize'), \
+                patch.object(service, '_compute_temperature_sync', side_effect=compute), \
+                patch.object(service, '_compute_humidity_sync', side_effect=compute), \
+                patch.object(service, '_compute_lst_sync', side_effect=compute):
+            result = await service.calculate_all_environmental(
+                farm_geojson=VALID_GEOJSON,
+                start_date="2024-01-01",
+                end_date="2024-01-31",
+            )
+
+        assert set(result) == {"temperature", "humidity", "lst"}
+        assert all(series == [{"date": "2024-01-15"}] for series in result.values())
+
+    @pytest.mark.asyncio
+    async def test_calculate_all_environmental_validates_once(self):
+        """Test inputs are validated and Earth Engine initialized once, not per dataset."""
+        service = NDVIService()
+
+        with patch.object(service.ee_manager, 'initialize') as mock_init, \
+                patch.object(
+                    service, '_validate_geojson', wraps=service._validate_geojson
+                ) as mock_geojson, \
+                patch.object(
+                    service, '_validate_date_range', wraps=service._validate_date_range
+                ) as mock_dates, \
+                patch.object(service, '_compute_temperature_sync', return_value=[]), \
+                patch.object(service, '_compute_humidity_sync', return_value=[]), \
+                patch.object(service, '_compute_lst_sync', return_value=[]):
+            await service.calculate_all_environmental(
+                farm_geojson=VALID_GEOJSON,
+                start_date="2024-01-01",
+                end_date="2024-01-31",
+            )
+
+        assert mock_geojson.call_count == 1
+        assert mock_dates.call_count == 1
+        assert mock_init.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_calculate_all_environmental_isolates_failures(self):
+        """Test one failing dataset does not discard the others."""
+        service = NDVIService()
+
+        with patch.object(service.ee_manager, 'initialize'), \
+                patch.object(service, '_compute_temperature_sync', return_value=[]), \
+                patch.object(
+                    service,
+                    '_compute_humidity_sync',
+                    side_effect=EarthEngineError("Connection failed"),
+                ), \
+                patch.object(service, '_compute_lst_sync', return_value=[]):
+            result = await service.calculate_all_environmental(
+                farm_geojson=VALID_GEOJSON,
+                start_date="2024-01-01",
+                end_date="2024-01-31",
+            )
+
+        assert result["temperature"] == []
+        assert isinstance(result["humidity"], EarthEngineError)
+        assert result["lst"] == []
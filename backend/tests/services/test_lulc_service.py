@@ -5,36 +5,40 @@ from unittest.mock import patch, MagicMock
 
 from app.services.lulc_service import LULCService, LULC_CLASS_NAMES
 from app.services.exceptions import InvalidGeometryError, InvalidDateRangeError
+from app.services.ndvi_service import NDVIService
+from app.utils.validation import validate_date_range
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Create LULC service instance."""
+    with patch("app.services.lulc_service.EarthEngineManager"):
+        return LULCService()
+
+
+@pytest.fixture(scope="module")
+def valid_geojson():
+    """Valid farm GeoJSON."""
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [0.0, 0.0],
+                    [0.1, 0.0],
+                    [0.1, 0.1],
+                    [0.0, 0.1],
+                    [0.0, 0.0],
+                ]
+            ],
+        },
+    }
 
 
 class TestLULCService:
     """Test LULC service classification."""
 
-    @pytest.fixture
-    def service(self):
-        """Create LULC service instance."""
-        with patch("app.services.lulc_service.EarthEngineManager"):
-            return LULCService()
-
-    @pytest.fixture
-    def valid_geojson(self):
-        """Valid farm GeoJSON."""
-        return {
-            "type": "Feature",
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": [
-                    [
-                        [0.0, 0.0],
-                        [0.1, 0.0],
-                        [0.1, 0.1],
-                        [0.0, 0.1],
-                        [0.0, 0.0],
-                    ]
-                ],
-            },
-        }
-
     def test_validate_geojson_valid(self, service, valid_geojson):
         """Test validation passes for valid GeoJSON."""
         service._validate_geojson(valid_geojson)
@@ -53,12 +57,41 @@ class TestLULCService:
         with pytest.raises(InvalidDateRangeError):
             service._validate_date_range("2023-12-31", "2023-01-01")
 
+    @pytest.mark.parametrize(
+        "start_date",
+        [
+            "2023-1-1",
+            "20230101",
+            "2023-W01-1",
+            "2023/01/01",
+            "2023-02-30",
+            "2023-01-01\n",
+            "\u0662\u0660\u0662\u0663-01-01",
+        ],
+    )
+    def test_validate_date_range_rejects_malformed(self, service, start_date):
+        """Test only strict YYYY-MM-DD dates are accepted."""
+        with pytest.raises(InvalidDateRangeError, match="YYYY-MM-DD"):
+            service._validate_date_range(start_date, "2023-12-31")
+
+    def test_validate_date_range_shares_ndvi_cache(self, service):
+        """Test LULC and NDVI validate through the same memoized helper."""
+        validate_date_range.cache_clear()
+
+        NDVIService._validate_date_range("2023-01-01", "2023-06-30")
+        service._validate_date_range("2023-01-01", "2023-06-30")
+
+        info = validate_date_range.cache_info()
+        assert info.hits == 1
+        assert info.currsize == 1
+
     def test_lulc_class_names_complete(self):
         """Test that all LULC class names are defined."""
         assert len(LULC_CLASS_NAMES) == 9
         assert LULC_CLASS_NAMES[0] == "Water"
         assert LULC_CLASS_NAMES[1] == "Trees"
         assert LULC_CLASS_NAMES[4] == "Crops"
+        assert isinstance(LULC_CLASS_NAMES, tuple)
 
     def test_format_lulc_response(self, service):
         """Test LULC response formatting."""
@@ -88,6 +121,38 @@ class TestLULCService:
         assert response["dominant_class"] is None
         assert len(response["classes"]) == 0
 
+    @pytest.mark.parametrize("n_classes", [1, 9, 1000])
+    def test_format_lulc_response_scales(self, service, n_classes):
+        """Totals, percentages and dominant class hold for many classes."""
+        class_areas = {i: float(i + 1) for i in range(n_classes)}
+        total = n_classes * (n_classes + 1) / 2
+
+        response = service._format_lulc_response(
+            class_areas, "2023-01-01", "2023-12-31"
+        )
+
+        assert response["total_area_ha"] == round(total, 2)
+        assert len(response["classes"]) == n_classes
+        assert [c["id"] for c in response["classes"]] == list(range(n_classes))
+        assert abs(sum(c["percentage"] for c in response["classes"]) - 100) < 0.01 * n_classes
+        assert response["classes"][-1]["area_ha"] == float(n_classes)
+        expected = (
+            LULC_CLASS_NAMES[n_classes - 1]
+            if n_classes <= len(LULC_CLASS_NAMES)
+            else f"Unknown ({n_classes - 1})"
+        )
+        assert response["dominant_class"] == expected
+
+    def test_format_lulc_response_zero_area(self, service):
+        """Zero total area yields zero percentages and no dominant class."""
+        response = service._format_lulc_response(
+            {1: 0.0, 4: 0.0}, "2023-01-01", "2023-12-31"
+        )
+
+        assert response["total_area_ha"] == 0.0
+        assert [c["percentage"] for c in response["classes"]] == [0.0, 0.0]
+        assert response["dominant_class"] is None
+
     @pytest.mark.asyncio
     async def test_classify_land_use_calls_sync(self, service, valid_geojson):
         """Test that async method calls sync computation."""
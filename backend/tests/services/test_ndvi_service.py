@@ -4,46 +4,80 @@ import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from datetime import datetime
 
-from app.services.ndvi_service import NDVIService
+from app.services.ndvi_service import (
+    NDVIService,
+    _cloud_filter,
+    _features_to_series,
+    _reducer,
+)
+from app.utils.validation import SUPPORTED_GEOMETRY_TYPES, validate_date_range
 from app.services.exceptions import (
     InvalidGeometryError,
     InvalidDateRangeError,
 )
 
 
-class TestNDVIService:
-    """Test NDVI service calculations."""
+@pytest.fixture
+def _clear_ee_object_caches():
+    """Drop shared EE filters/reducers built against a patched ee module."""
+    _cloud_filter.cache_clear()
+    _reducer.cache_clear()
+    yield
+    _cloud_filter.cache_clear()
+    _reducer.cache_clear()
 
-    @pytest.fixture
-    def service(self):
-        """Create NDVI service instance."""
-        with patch("app.services.ndvi_service.EarthEngineManager"):
-            return NDVIService()
 
-    @pytest.fixture
-    def valid_geojson(self):
-        """Valid farm GeoJSON."""
-        return {
-            "type": "Feature",
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": [
-                    [
-                        [0.0, 0.0],
-                        [1.0, 0.0],
-                        [1.0, 1.0],
-                        [0.0, 1.0],
-                        [0.0, 0.0],
-                    ]
-                ],
-            },
-        }
+@pytest.fixture(scope="module")
+def service():
+    """Create NDVI service instance."""
+    with patch("app.services.ndvi_service.EarthEngineManager"):
+        return NDVIService()
+
+
+@pytest.fixture(scope="module")
+def valid_geojson():
+    """Valid farm GeoJSON."""
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [0.0, 0.0],
+                    [1.0, 0.0],
+                    [1.0, 1.0],
+                    [0.0, 1.0],
+                    [0.0, 0.0],
+                ]
+            ],
+        },
+    }
+
+
+class TestNDVIService:
+    """Test NDVI service calculations."""
 
     def test_validate_geojson_valid(self, service, valid_geojson):
         """Test validation passes for valid GeoJSON."""
         # Should not raise
         service._validate_geojson(valid_geojson)
 
+    @pytest.mark.parametrize("geometry_type", sorted(SUPPORTED_GEOMETRY_TYPES))
+    def test_validate_geojson_supported_types(self, service, geometry_type):
+        """Test validation passes for every supported geometry type."""
+        geojson = {
+            "type": "Feature",
+            "geometry": {"type": geometry_type, "coordinates": [[0, 0]]},
+        }
+
+        service._validate_geojson(geojson)
+
+    @pytest.mark.parametrize("geojson", [None, "Feature", {"geometry": None}])
+    def test_validate_geojson_malformed(self, service, geojson):
+        """Test validation wraps structural errors as InvalidGeometryError."""
+        with pytest.raises(InvalidGeometryError):
+            service._validate_geojson(geojson)
+
     def test_validate_geojson_missing_geometry(self, service):
         """Test validation fails for missing geometry."""
         geojson = {"type": "Feature"}
@@ -84,6 +118,31 @@ class TestNDVIService:
         with pytest.raises(InvalidDateRangeError):
             service._validate_date_range("2023-1-1", "2023-12-31")
 
+    @pytest.mark.parametrize(
+        "start_date",
+        [
+            "20230101",
+            "2023-W01-1",
+            "2023/01/01",
+            "2023-02-30",
+            "2023-01-1 ",
+            "2023-01-01\n",
+            "\u0662\u0660\u0662\u0663-01-01",
+        ],
+    )
+    def test_validate_date_range_rejects_non_iso_day(self, service, start_date):
+        """Test only strict YYYY-MM-DD dates are accepted."""
+        with pytest.raises(InvalidDateRangeError):
+            service._validate_date_range(start_date, "2023-12-31")
+
+    def test_validate_date_range_rejects_bad_shape_before_parsing(self, service):
+        """Test malformed strings are rejected without reaching the date parser."""
+        with patch("app.utils.validation.date") as mock_date:
+            with pytest.raises(InvalidDateRangeError, match="YYYY-MM-DD"):
+                service._validate_date_range("2023-1-1", "2023-12-31")
+
+        mock_date.fromisoformat.assert_not_called()
+
     def test_validate_date_range_start_after_end(self, service):
         """Test validation fails when start after end."""
         with pytest.raises(InvalidDateRangeError):
@@ -99,6 +158,20 @@ class TestNDVIService:
         with pytest.raises(InvalidDateRangeError):
             service._validate_date_range("2015-01-01", "2025-01-01")
 
+    def test_validate_date_range_memoized(self, service):
+        """Test repeated valid ranges hit the cache and failures are not cached."""
+        validate_date_range.cache_clear()
+
+        service._validate_date_range("2023-01-01", "2023-06-30")
+        service._validate_date_range("2023-01-01", "2023-06-30")
+        for _ in range(2):
+            with pytest.raises(InvalidDateRangeError):
+                service._validate_date_range("2023-06-30", "2023-01-01")
+
+        info = validate_date_range.cache_info()
+        assert info.hits == 1
+        assert info.currsize == 1
+
     @pytest.mark.asyncio
     async def test_calculate_ndvi_time_series_calls_sync(self, service, valid_geojson):
         """Test that async method calls sync computation in thread."""
@@ -112,32 +185,94 @@ class TestNDVIService:
             assert result == []
             mock_sync.assert_called_once()
 
-    def test_geojson_to_ee_geometry_polygon(self, service):
+    def test_features_to_series_filters_and_sorts(self):
+        """Test null NDVI dates are dropped and the series is date-sorted."""
+        features = [
+            {"properties": {"date": "2023-03-01", "ndvi": 0.61, "std": 0.05}},
+            {"properties": {"date": "2023-01-01", "ndvi": None, "std": None}},
+            {"properties": {"date": "2023-02-01", "ndvi": 0.55}},
+        ]
+
+        result = _features_to_series(features)
+
+        assert result == [
+            {"date": "2023-02-01", "ndvi": 0.55, "std": 0.0},
+            {"date": "2023-03-01", "ndvi": 0.61, "std": 0.05},
+        ]
+        assert all(type(r["ndvi"]) is float for r in result)
+
+    def test_features_to_series_null_std_is_zero(self):
+        """Test a null std on a kept date becomes 0 rather than NaN."""
+        features = [
+            {"properties": {"date": "2023-01-01", "ndvi": 0.5, "std": None}},
+        ]
+
+        result = _features_to_series(features)
+
+        assert result == [{"date": "2023-01-01", "ndvi": 0.5, "std": 0.0}]
+
+    @pytest.mark.usefixtures("_clear_ee_object_caches")
+    def test_compute_ndvi_sync_filters_null_ndvi_server_side(
+        self, service, valid_geojson, fake_ee
+    ):
+        """Test null NDVI features are filtered by Earth Engine before getInfo()."""
+        collection = fake_ee.ImageCollection.return_value.filterBounds.return_value
+        collection = collection.filterDate.return_value.filter.return_value
+        collection.size.return_value.getInfo.return_value = 2
+        stats = collection.map.return_value.map.return_value
+        filtered = stats.filter.return_value
+        filtered.getInfo.return_value = {
+            "features": [
+                {"properties": {"date": "2023-01-01", "ndvi": 0.5, "std": 0.1}}
+            ]
+        }
+
+        result = service._compute_ndvi_sync(valid_geojson, "2023-01-01", "2023-12-31")
+
+        fake_ee.Filter.notNull.assert_called_once_with(["ndvi"])
+        stats.filter.assert_called_once_with(fake_ee.Filter.notNull.return_value)
+        stats.getInfo.assert_not_called()
+        assert result == [{"date": "2023-01-01", "ndvi": 0.5, "std": 0.1}]
+
+    @pytest.mark.usefixtures("_clear_ee_object_caches")
+    def test_ee_filters_and_reducers_built_once(self, fake_ee):
+        """Test the cloud filter and reducers are shared across calls."""
+        assert _cloud_filter() is _cloud_filter()
+        assert _reducer("mean") is _reducer("mean")
+        _reducer("stdDev")
+
+        fake_ee.Filter.lt.assert_called_once_with("CLOUDY_PIXEL_PERCENTAGE", 20)
+        fake_ee.Reducer.mean.assert_called_once_with()
+        fake_ee.Reducer.stdDev.assert_called_once_with()
+
+    def test_features_to_series_empty(self):
+        """Test an empty feature list gives an empty series."""
+        assert _features_to_series([]) == []
+
+    def test_geojson_to_ee_geometry_polygon(self, service, fake_ee):
         """Test GeoJSON to EE geometry conversion for Polygon."""
-        with patch("app.services.ndvi_service.ee"):
-            geojson = {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Polygon",
-                    "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]],
-                },
-            }
-
-            with patch("app.services.ndvi_service.ee.Geometry.Polygon") as mock_poly:
-                service._geojson_to_ee_geometry(geojson)
-                mock_poly.assert_called_once()
-
-    def test_geojson_to_ee_geometry_point(self, service):
+        geojson = {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]],
+            },
+        }
+
+        with patch.object(fake_ee.Geometry, "Polygon") as mock_poly:
+            service._geojson_to_ee_geometry(geojson)
+            mock_poly.assert_called_once()
+
+    def test_geojson_to_ee_geometry_point(self, service, fake_ee):
         """Test GeoJSON to EE geometry conversion for Point."""
-        with patch("app.services.ndvi_service.ee"):
-            geojson = {
-                "type": "Feature",
-                "geometry": {"type": "Point", "coordinates": [0.5, 0.5]},
-            }
-
-            with patch("app.services.ndvi_service.ee.Geometry.Point") as mock_point:
-                service._geojson_to_ee_geometry(geojson)
-                mock_point.assert_called_once()
+        geojson = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [0.5, 0.5]},
+        }
+
+        with patch.object(fake_ee.Geometry, "Point") as mock_point:
+            service._geojson_to_ee_geometry(geojson)
+            mock_point.assert_called_once()
 
 
 if __name__ == "__main__":
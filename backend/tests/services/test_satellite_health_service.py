@@ -8,22 +8,120 @@ Tests cover:
 - Parallel execution of satellite checks
 """
 
+import asyncio
+import threading
+
+import ee
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
+from unittest.mock import Mock, patch, MagicMock
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
-from app.services.satellite_health_service import SatelliteHealthService
+from app.services.satellite_health_service import (
+    SatelliteHealthService,
+    clear_summary_cache,
+)
 from app.services.exceptions import (
     SatelliteHealthCheckError,
     EarthEngineQuotaError,
 )
 from app.models.satellite_status import SatelliteStatus
 
+# Fixed timestamp for mock records, so results do not depend on the clock
+FIXED_NOW = datetime(2024, 1, 15, 12, 0, 0)
+
+
+class FakeCount:
+    """Stand-in for the ee.Number returned by ImageCollection.size()."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def getInfo(self):
+        return self._value
+
+
+class FakeImageCollection:
+    """
+    Pre-wired stand-in for the ee.ImageCollection query pipeline.
+
+    filterDate() returns the collection itself and filter() returns the
+    narrower `filtered` collection when given, so a test sets up a whole
+    query with one constructor instead of a MagicMock return_value chain.
+    """
+
+    def __init__(self, size, filtered=None):
+        self._size = size
+        self._filtered = filtered
+
+    def filterDate(self, *args, **kwargs):
+        return self
+
+    def filter(self, *args, **kwargs):
+        return self._filtered if self._filtered is not None else self
+
+    def size(self):
+        return FakeCount(self._size)
+
+
+class FakeDictionary:
+    """Stand-in for ee.Dictionary that resolves FakeCount values on getInfo()."""
 
-# Mock ee module for tests
-class MockEEException(Exception):
-    """Mock Earth Engine exception."""
-    pass
+    def __init__(self, values):
+        self._values = values
+
+    def getInfo(self):
+        return {key: value.getInfo() for key, value in self._values.items()}
+
+
+class FakeResult:
+    """Stand-in for the Result returned by AsyncSession.execute()."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+
+class FakeDB:
+    """
+    Minimal AsyncSession stand-in that records what the service did to it.
+
+    Only the I/O methods are coroutines, as on the real session; add() is
+    synchronous. Every execute() returns `rows`, and commit() raises
+    `commit_error` when one is set.
+    """
+
+    def __init__(self, rows=(), commit_error=None):
+        self.rows = list(rows)
+        self.commit_error = commit_error
+        self.added = []
+        self.committed = False
+        self.rolled_back = False
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def execute(self, stmt):
+        return FakeResult(self.rows)
+
+    async def commit(self):
+        if self.commit_error is not None:
+            raise self.commit_error
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
 
 
 # ============================================================================
@@ -31,50 +129,58 @@ class MockEEException(Exception):
 # ============================================================================
 
 
-@pytest.fixture
-def mock_ee_manager_setup():
-    """Setup mock Earth Engine manager and ee module for all tests."""
-    with patch("app.services.satellite_health_service.EarthEngineManager") as mock_manager, \
-         patch("app.services.satellite_health_service.ee") as mock_ee:
-        manager_instance = MagicMock()
-        manager_instance.initialize = Mock()
-        mock_manager.get_instance.return_value = manager_instance
-        
-        # Setup ee mock for exception handling
-        mock_ee.EEException = MockEEException
-        mock_ee.ImageCollection = MagicMock()
-        
-        yield manager_instance, mock_ee
+@pytest.fixture(autouse=True)
+def _clear_summary_cache():
+    """Start and end every test without a cached health summary."""
+    clear_summary_cache()
+    yield
+    clear_summary_cache()
 
 
 @pytest.fixture
-def satellite_service_and_mocks(mock_ee_manager_setup):
-    """Create a SatelliteHealthService instance with mocks in place."""
-    manager_instance, mock_ee = mock_ee_manager_setup
+def satellite_service():
+    """Create a SatelliteHealthService instance with a mocked EE manager."""
     service = SatelliteHealthService()
-    # Override the ee_manager with our mocked one
-    service.ee_manager = manager_instance
-    return service, manager_instance, mock_ee
+    service.ee_manager = MagicMock()
+    return service
 
 
 @pytest.fixture
-def satellite_service(satellite_service_and_mocks):
-    """Create a SatelliteHealthService instance."""
-    service, _, _ = satellite_service_and_mocks
-    return service
+def mock_ee_manager(monkeypatch, fake_ee):
+    """Wire the shared fake ee module for tests that query Earth Engine."""
+    monkeypatch.setattr(fake_ee, "ImageCollection", MagicMock())
+    monkeypatch.setattr(fake_ee, "Dictionary", MagicMock(side_effect=FakeDictionary))
+    return fake_ee
 
 
 @pytest.fixture
-def mock_ee_manager(satellite_service_and_mocks):
-    """Get the mocked ee module."""
-    _, _, mock_ee = satellite_service_and_mocks
-    return mock_ee
+def fake_db():
+    """In-memory stand-in for a database session."""
+    return FakeDB()
+
+
+@pytest.fixture(scope="module")
+async def db_engine():
+    """In-memory SQLite engine with the satellite_status table, built once."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(SatelliteStatus.__table__.create)
+    yield engine
+    await engine.dispose()
 
 
 @pytest.fixture
-def mock_db():
-    """Mock database session."""
-    return AsyncMock()
+async def db(db_engine):
+    """Fresh session per test; rows written by the test are removed afterwards."""
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        yield session
+        await session.rollback()
+        await session.execute(delete(SatelliteStatus))
+        await session.commit()
 
 
 @pytest.fixture
@@ -103,17 +209,9 @@ def sample_satellite_health_data():
 async def test_sentinel2_health_operational(satellite_service, mock_ee_manager):
     """Test Sentinel-2 health check with operational status."""
     # Mock successful Earth Engine query
-    mock_collection = MagicMock()
-    mock_filtered = MagicMock()
-    mock_low_cloud = MagicMock()
-
-    mock_ee_manager.ImageCollection.return_value = mock_collection
-    mock_collection.filterDate.return_value = mock_filtered
-    mock_filtered.filter.return_value = mock_low_cloud
-    
-    # Mock size query
-    mock_low_cloud.size.return_value.getInfo.return_value = 143
-    mock_filtered.size.return_value.getInfo.return_value = 150
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(
+        150, filtered=FakeImageCollection(143)
+    )
 
     result = await satellite_service.check_sentinel2_health()
 
@@ -121,22 +219,17 @@ async def test_sentinel2_health_operational(satellite_service, mock_ee_manager):
     assert result["coverage_percent"] == pytest.approx(95.33, rel=1)
     assert result["data_quality"] == "high"
     assert 0 <= result["coverage_percent"] <= 100
+    # Total and low-cloud counts are fetched in a single round-trip
+    mock_ee_manager.Dictionary.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_sentinel2_health_degraded(satellite_service, mock_ee_manager):
     """Test Sentinel-2 health check with degraded status."""
-    mock_collection = MagicMock()
-    mock_filtered = MagicMock()
-    mock_low_cloud = MagicMock()
-
-    mock_ee_manager.ImageCollection.return_value = mock_collection
-    mock_collection.filterDate.return_value = mock_filtered
-    mock_filtered.filter.return_value = mock_low_cloud
-    
     # Low coverage - degraded status
-    mock_low_cloud.size.return_value.getInfo.return_value = 70
-    mock_filtered.size.return_value.getInfo.return_value = 150
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(
+        150, filtered=FakeImageCollection(70)
+    )
 
     result = await satellite_service.check_sentinel2_health()
 
@@ -147,14 +240,8 @@ async def test_sentinel2_health_degraded(satellite_service, mock_ee_manager):
 @pytest.mark.asyncio
 async def test_sentinel2_health_offline(satellite_service, mock_ee_manager):
     """Test Sentinel-2 health check with offline status."""
-    mock_collection = MagicMock()
-    mock_filtered = MagicMock()
-
-    mock_ee_manager.ImageCollection.return_value = mock_collection
-    mock_collection.filterDate.return_value = mock_filtered
-    
     # No data - offline status
-    mock_filtered.size.return_value.getInfo.return_value = 0
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(0)
 
     result = await satellite_service.check_sentinel2_health()
 
@@ -165,7 +252,7 @@ async def test_sentinel2_health_offline(satellite_service, mock_ee_manager):
 @pytest.mark.asyncio
 async def test_sentinel2_quota_error(satellite_service, mock_ee_manager):
     """Test Sentinel-2 health check with quota error."""
-    mock_ee_manager.ImageCollection.side_effect = MockEEException(
+    mock_ee_manager.ImageCollection.side_effect = ee.EEException(
         "Quota exceeded"
     )
 
@@ -181,37 +268,24 @@ async def test_sentinel2_quota_error(satellite_service, mock_ee_manager):
 @pytest.mark.asyncio
 async def test_landsat8_health_operational(satellite_service, mock_ee_manager):
     """Test Landsat-8 health check with operational status."""
-    mock_collection = MagicMock()
-    mock_filtered = MagicMock()
-    mock_good = MagicMock()
-
-    mock_ee_manager.ImageCollection.return_value = mock_collection
-    mock_collection.filterDate.return_value = mock_filtered
-    mock_filtered.filter.return_value = mock_good
-    
-    mock_good.size.return_value.getInfo.return_value = 82
-    mock_filtered.size.return_value.getInfo.return_value = 89
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(
+        89, filtered=FakeImageCollection(82)
+    )
 
     result = await satellite_service.check_landsat8_health()
 
     assert result["status"] == "operational"
     assert 90 <= result["coverage_percent"] <= 100
     assert result["data_quality"] == "high"
+    mock_ee_manager.Dictionary.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_landsat8_health_degraded(satellite_service, mock_ee_manager):
     """Test Landsat-8 health check with degraded status."""
-    mock_collection = MagicMock()
-    mock_filtered = MagicMock()
-    mock_good = MagicMock()
-
-    mock_ee_manager.ImageCollection.return_value = mock_collection
-    mock_collection.filterDate.return_value = mock_filtered
-    mock_filtered.filter.return_value = mock_good
-    
-    mock_good.size.return_value.getInfo.return_value = 60
-    mock_filtered.size.return_value.getInfo.return_value = 89
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(
+        89, filtered=FakeImageCollection(60)
+    )
 
     result = await satellite_service.check_landsat8_health()
 
@@ -227,14 +301,8 @@ async def test_landsat8_health_degraded(satellite_service, mock_ee_manager):
 @pytest.mark.asyncio
 async def test_era5_health_operational(satellite_service, mock_ee_manager):
     """Test ERA5-Land health check with operational status."""
-    mock_collection = MagicMock()
-    mock_filtered = MagicMock()
-
-    mock_ee_manager.ImageCollection.return_value = mock_collection
-    mock_collection.filterDate.return_value = mock_filtered
-    
     # 99.7% availability (717 out of 720 hourly records)
-    mock_filtered.size.return_value.getInfo.return_value = 717
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(717)
 
     result = await satellite_service.check_era5_health()
 
@@ -246,14 +314,8 @@ async def test_era5_health_operational(satellite_service, mock_ee_manager):
 @pytest.mark.asyncio
 async def test_era5_health_degraded(satellite_service, mock_ee_manager):
     """Test ERA5-Land health check with degraded status."""
-    mock_collection = MagicMock()
-    mock_filtered = MagicMock()
-
-    mock_ee_manager.ImageCollection.return_value = mock_collection
-    mock_collection.filterDate.return_value = mock_filtered
-    
     # 90% availability (648 out of 720)
-    mock_filtered.size.return_value.getInfo.return_value = 648
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(648)
 
     result = await satellite_service.check_era5_health()
 
@@ -261,13 +323,106 @@ async def test_era5_health_degraded(satellite_service, mock_ee_manager):
     assert 80 <= result["coverage_percent"] < 95
 
 
+@pytest.mark.asyncio
+async def test_health_checks_run_on_shared_pool(satellite_service):
+    """Test blocking checks run on the dedicated ee-health pool."""
+    thread_names = []
+
+    def check():
+        thread_names.append(threading.current_thread().name)
+        return {"status": "operational"}
+
+    other_service = SatelliteHealthService()
+    with patch.object(satellite_service, "_check_sentinel2_health_sync", side_effect=check), \
+            patch.object(satellite_service, "_check_landsat8_health_sync", side_effect=check), \
+            patch.object(other_service, "_check_era5_health_sync", side_effect=check):
+        await asyncio.gather(
+            satellite_service.check_sentinel2_health(),
+            satellite_service.check_landsat8_health(),
+            other_service.check_era5_health(),
+        )
+
+    assert len(thread_names) == 3
+    assert all(name.startswith("ee-health") for name in thread_names)
+
+
+@pytest.mark.asyncio
+async def test_health_check_reuses_cached_result(
+    satellite_service, mock_ee_manager, ee_cache_dir
+):
+    """Test a repeated health check within the TTL skips Earth Engine."""
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(
+        150, filtered=FakeImageCollection(143)
+    )
+
+    first = await satellite_service.check_sentinel2_health()
+    second = await satellite_service.check_sentinel2_health()
+
+    assert second == first
+    assert mock_ee_manager.ImageCollection.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_forced_health_check_bypasses_and_overwrites_cache(
+    satellite_service, mock_ee_manager, ee_cache_dir
+):
+    """Test a forced check queries Earth Engine and replaces the cached result."""
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(
+        150, filtered=FakeImageCollection(143)
+    )
+    await satellite_service.check_sentinel2_health()
+
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(0)
+    forced = await satellite_service.check_sentinel2_health(force=True)
+    cached = await satellite_service.check_sentinel2_health()
+
+    assert mock_ee_manager.ImageCollection.call_count == 2
+    assert forced["status"] == "offline"
+    assert cached == forced
+
+
+@pytest.mark.asyncio
+async def test_update_all_satellite_status_forwards_force(satellite_service, fake_db):
+    """Test a forced status update forces every health check."""
+    health = {
+        "status": "operational",
+        "coverage_percent": 95.0,
+        "accuracy_percent": 95.0,
+        "data_quality": "high",
+        "metadata": {},
+    }
+    with patch.object(satellite_service, "check_sentinel2_health", return_value=health) as s2, \
+            patch.object(satellite_service, "check_landsat8_health", return_value=health) as l8, \
+            patch.object(satellite_service, "check_era5_health", return_value=health) as era5:
+        await satellite_service.update_all_satellite_status(fake_db, force=True)
+
+    for check in (s2, l8, era5):
+        check.assert_awaited_once_with(force=True)
+
+
+@pytest.mark.asyncio
+async def test_health_check_cache_is_per_satellite(
+    satellite_service, mock_ee_manager, ee_cache_dir
+):
+    """Test different satellites are not served each other's results."""
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(
+        717, filtered=FakeImageCollection(700)
+    )
+
+    await satellite_service.check_sentinel2_health()
+    await satellite_service.check_era5_health()
+
+    assert mock_ee_manager.ImageCollection.call_count == 2
+
+
 # ============================================================================
 # Database Update Tests
 # ============================================================================
 
 
 @pytest.mark.asyncio
-async def test_update_all_satellite_status_success(satellite_service, mock_db):
+@pytest.mark.xdist_group("db")
+async def test_update_all_satellite_status_success(satellite_service, db):
     """Test updating all satellite status records successfully."""
     with patch.object(
         satellite_service, "check_sentinel2_health", return_value={
@@ -297,31 +452,94 @@ async def test_update_all_satellite_status_success(satellite_service, mock_db):
             "metadata": {},
         }
     ):
-        # Setup mock database
-        mock_db.execute.return_value.scalar_one_or_none.return_value = None
-        mock_db.add = AsyncMock()
-        mock_db.commit = AsyncMock()
+        await satellite_service.update_all_satellite_status(db)
+        # A second refresh updates the existing rows instead of adding more
+        await satellite_service.update_all_satellite_status(db)
+
+    rows = (await db.execute(select(SatelliteStatus))).scalars().all()
+    # Should have 3 records for the 3 satellites
+    assert sorted(r.satellite_name for r in rows) == [
+        "era5-land", "landsat-8", "sentinel-2"
+    ]
+    assert all(r.status == "operational" for r in rows)
+
+
+@pytest.mark.asyncio
+@pytest.mark.xdist_group("db")
+async def test_update_all_satellite_status_runs_checks_concurrently(
+    satellite_service, db
+):
+    """Test the three blocking Earth Engine checks overlap on worker threads."""
+    health = {
+        "status": "operational",
+        "coverage_percent": 95.0,
+        "accuracy_percent": 95.0,
+        "data_quality": "high",
+        "metadata": {},
+    }
+
+    # Each check waits for the other two; run serially, the barrier would
+    # time out and the checks would be recorded as failures
+    barrier = threading.Barrier(3, timeout=5)
 
-        await satellite_service.update_all_satellite_status(mock_db)
+    def blocking_check():
+        barrier.wait()
+        return health
 
-        # Verify database operations
-        assert mock_db.commit.awaited
-        # Should have 3 database adds for the 3 satellites
-        assert mock_db.add.call_count >= 3
+    with patch.object(satellite_service, "_check_sentinel2_health_sync", side_effect=blocking_check), \
+            patch.object(satellite_service, "_check_landsat8_health_sync", side_effect=blocking_check), \
+            patch.object(satellite_service, "_check_era5_health_sync", side_effect=blocking_check):
+        await satellite_service.update_all_satellite_status(db)
+
+    rows = (await db.execute(select(SatelliteStatus))).scalars().all()
+    assert len(rows) == 3
+    assert all(row.status == "operational" for row in rows)
+    assert not barrier.broken
 
 
 @pytest.mark.asyncio
-async def test_update_all_satellite_status_with_error(satellite_service, mock_db):
-    """Test satellite status update with error handling."""
+async def test_update_all_satellite_status_with_error(satellite_service, fake_db):
+    """Test a failing health check is recorded as unknown, not raised."""
+    health = {
+        "status": "operational",
+        "coverage_percent": 95.0,
+        "accuracy_percent": 95.0,
+        "data_quality": "high",
+        "metadata": {},
+    }
     with patch.object(
         satellite_service, "check_sentinel2_health", side_effect=ee.EEException("API error")
-    ):
+    ), patch.object(satellite_service, "check_landsat8_health", return_value=health), \
+            patch.object(satellite_service, "check_era5_health", return_value=health):
         # Should handle the error gracefully
+        await satellite_service.update_all_satellite_status(fake_db)
+
+    statuses = {s.satellite_name: s for s in fake_db.added}
+    assert len(fake_db.added) == 3
+    assert statuses["sentinel-2"].status == "unknown"
+    assert statuses["sentinel-2"].health_metadata == {"error": "API error"}
+    assert fake_db.committed
+
+
+@pytest.mark.asyncio
+async def test_update_all_satellite_status_db_error_rolls_back(satellite_service):
+    """Test a failed commit is rolled back and surfaced as a health check error."""
+    db = FakeDB(commit_error=RuntimeError("database unavailable"))
+    health = {
+        "status": "operational",
+        "coverage_percent": 95.0,
+        "accuracy_percent": 95.0,
+        "data_quality": "high",
+        "metadata": {},
+    }
+    with patch.object(satellite_service, "check_sentinel2_health", return_value=health), \
+            patch.object(satellite_service, "check_landsat8_health", return_value=health), \
+            patch.object(satellite_service, "check_era5_health", return_value=health):
         with pytest.raises(SatelliteHealthCheckError):
-            await satellite_service.update_all_satellite_status(mock_db)
+            await satellite_service.update_all_satellite_status(db)
 
-        # Rollback should be called on error
-        assert mock_db.rollback.awaited
+    # Rollback should be called on error
+    assert db.rolled_back
 
 
 # ============================================================================
@@ -330,11 +548,10 @@ async def test_update_all_satellite_status_with_error(satellite_service, mock_db
 
 
 @pytest.mark.asyncio
-async def test_get_satellite_health_summary_no_records(satellite_service, mock_db):
+@pytest.mark.xdist_group("db")
+async def test_get_satellite_health_summary_no_records(satellite_service, db):
     """Test health summary retrieval when no records exist."""
-    mock_db.execute.return_value.scalars.return_value.all.return_value = []
-
-    result = await satellite_service.get_satellite_health_summary(mock_db)
+    result = await satellite_service.get_satellite_health_summary(db)
 
     assert result["total_satellites"] == 0
     assert result["operational_count"] == 0
@@ -344,36 +561,80 @@ async def test_get_satellite_health_summary_no_records(satellite_service, mock_d
 
 
 @pytest.mark.asyncio
-async def test_get_satellite_health_summary_with_records(satellite_service, mock_db):
+@pytest.mark.xdist_group("db")
+async def test_get_satellite_health_summary_with_records(satellite_service, db):
     """Test health summary retrieval with satellite records."""
-    # Create mock satellite status records
-    mock_satellites = [
-        Mock(
-            satellite_name="sentinel-2",
-            status="operational",
-            uptime_percent=98.7,
-        ),
-        Mock(
-            satellite_name="landsat-8",
-            status="operational",
-            uptime_percent=97.2,
-        ),
-        Mock(
-            satellite_name="era5-land",
-            status="degraded",
-            uptime_percent=95.0,
-        ),
-    ]
-    
-    mock_db.execute.return_value.scalars.return_value.all.return_value = mock_satellites
+    db.add_all(
+        [
+            SatelliteStatus(
+                satellite_name="sentinel-2",
+                status="operational",
+                uptime_percent=98.7,
+            ),
+            SatelliteStatus(
+                satellite_name="landsat-8",
+                status="operational",
+                uptime_percent=97.2,
+            ),
+            SatelliteStatus(
+                satellite_name="era5-land",
+                status="degraded",
+                uptime_percent=95.0,
+            ),
+        ]
+    )
+    await db.commit()
 
-    result = await satellite_service.get_satellite_health_summary(mock_db)
+    result = await satellite_service.get_satellite_health_summary(db)
 
     assert result["total_satellites"] == 3
     assert result["operational_count"] == 2
     assert result["degraded_count"] == 1
     assert result["offline_count"] == 0
     assert result["average_uptime"] == pytest.approx(96.97, rel=0.1)
+    assert [s.satellite_name for s in result["satellites"]] == [
+        "era5-land", "landsat-8", "sentinel-2"
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.xdist_group("db")
+async def test_get_satellite_health_summary_is_cached(satellite_service, db):
+    """Test repeated summary requests within the TTL skip the database."""
+    db.add(SatelliteStatus(satellite_name="sentinel-2", status="operational"))
+    await db.commit()
+
+    first = await satellite_service.get_satellite_health_summary(db)
+    with patch.object(db, "execute") as mock_execute:
+        second = await satellite_service.get_satellite_health_summary(db)
+
+    mock_execute.assert_not_called()
+    assert second == first
+    assert second is not first
+
+
+@pytest.mark.asyncio
+@pytest.mark.xdist_group("db")
+async def test_update_all_satellite_status_invalidates_summary(satellite_service, db):
+    """Test a status refresh drops the cached summary."""
+    assert (await satellite_service.get_satellite_health_summary(db))[
+        "total_satellites"
+    ] == 0
+
+    health = {
+        "status": "operational",
+        "coverage_percent": 95.0,
+        "accuracy_percent": 95.0,
+        "data_quality": "high",
+        "metadata": {},
+    }
+    with patch.object(satellite_service, "check_sentinel2_health", return_value=health), \
+            patch.object(satellite_service, "check_landsat8_health", return_value=health), \
+            patch.object(satellite_service, "check_era5_health", return_value=health):
+        await satellite_service.update_all_satellite_status(db)
+
+    result = await satellite_service.get_satellite_health_summary(db)
+    assert result["total_satellites"] == 3
 
 
 # ============================================================================
@@ -381,8 +642,14 @@ async def test_get_satellite_health_summary_with_records(satellite_service, mock
 # ============================================================================
 
 
+@pytest.mark.xfail(
+    reason="SatelliteHealthService has no get_health_history; satellite_status "
+    "keeps only the latest check per satellite",
+    raises=AttributeError,
+    strict=True,
+)
 @pytest.mark.asyncio
-async def test_get_health_history(satellite_service, mock_db):
+async def test_get_health_history(satellite_service):
     """Test retrieving satellite health history."""
     mock_records = [
         Mock(
@@ -392,14 +659,13 @@ async def test_get_health_history(satellite_service, mock_db):
             accuracy_percent=92.3,
             data_quality="high",
             uptime_percent=98.7,
-            last_update=datetime.utcnow(),
+            last_update=FIXED_NOW,
         ),
     ]
-    
-    mock_db.execute.return_value.scalars.return_value.all.return_value = mock_records
+    db = FakeDB(rows=mock_records)
 
     result = await satellite_service.get_health_history(
-        mock_db, 
+        db,
         satellite_name="sentinel-2",
         days=7
     )
@@ -416,26 +682,20 @@ async def test_get_health_history(satellite_service, mock_db):
 
 def test_coverage_threshold_constants():
     """Test that coverage thresholds are properly configured."""
-    service = SatelliteHealthService()
-    
-    assert service.COVERAGE_THRESHOLD_OPERATIONAL == 90.0
-    assert service.COVERAGE_THRESHOLD_DEGRADED == 50.0
-    assert service.COVERAGE_THRESHOLD_OPERATIONAL > service.COVERAGE_THRESHOLD_DEGRADED
+    assert SatelliteHealthService.COVERAGE_THRESHOLD_OPERATIONAL == 90.0
+    assert SatelliteHealthService.COVERAGE_THRESHOLD_DEGRADED == 50.0
+    assert (
+        SatelliteHealthService.COVERAGE_THRESHOLD_OPERATIONAL
+        > SatelliteHealthService.COVERAGE_THRESHOLD_DEGRADED
+    )
 
 
 @pytest.mark.asyncio
 async def test_health_check_metadata_structure(satellite_service, mock_ee_manager):
     """Test that health check returns proper metadata structure."""
-    mock_collection = MagicMock()
-    mock_filtered = MagicMock()
-    mock_low_cloud = MagicMock()
-
-    mock_ee_manager.ImageCollection.return_value = mock_collection
-    mock_collection.filterDate.return_value = mock_filtered
-    mock_filtered.filter.return_value = mock_low_cloud
-    
-    mock_low_cloud.size.return_value.getInfo.return_value = 143
-    mock_filtered.size.return_value.getInfo.return_value = 150
+    mock_ee_manager.ImageCollection.return_value = FakeImageCollection(
+        150, filtered=FakeImageCollection(143)
+    )
 
     result = await satellite_service.check_sentinel2_health()
 